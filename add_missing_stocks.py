@@ -2,22 +2,38 @@
 Add missing stocks (NVDA, TSLA) to the universe
 """
 
+import argparse
+import os
+import shutil
 import sys
 sys.path.append('.')
 
+from pathlib import Path
+
 import pandas as pd
 from src.data.collectors import StockDataCollector
 from src.analysis.feature_engineering import FeatureEngineer
 from src.data.universe import universe_builder
+from src.utils.helpers import read_df, write_categories, write_df
+
+def link_file(src: Path, dst: Path):
+    """Hardlink dst to src (falls back to a copy across filesystems)"""
+    dst.parent.mkdir(parents=True, exist_ok=True)
+    if dst.exists():
+        dst.unlink()
+    try:
+        os.link(src, dst)
+    except OSError:
+        shutil.copyfile(src, dst)
 
-def main():
+def main(export_csv: bool = False):
     print("\n" + "="*80)
     print("➕ ADDING MISSING STOCKS TO UNIVERSE")
     print("="*80 + "\n")
     
     # Load existing data
     print("Loading existing universe...")
-    df_existing = pd.read_csv('data/processed/stock_universe_engineered.csv')
+    df_existing = read_df('data/processed/stock_universe_engineered')
     print(f"Current companies: {len(df_existing)}")
     
     # Stocks to add
@@ -31,48 +47,53 @@ def main():
     df_new = collector.batch_fetch(missing_stocks)
     
     # Add sector category
-    df_new['sector_category'] = df_new['symbol'].apply(universe_builder.get_sector_for_symbol)
+    df_new['sector_category'] = df_new['symbol'].map(universe_builder.sector_map).fillna('unknown')
     
-    # Add industry comparisons
-    df_new = collector.add_industry_comparisons(df_new)
+    # Add industry comparisons, reusing cached sector benchmarks instead of
+    # recomputing them from the two new rows
+    benchmarks_path = Path('data/cache/sector_benchmarks.parquet')
+    sector_stats = pd.read_parquet(benchmarks_path) if benchmarks_path.exists() else None
+    df_new = collector.add_industry_comparisons(df_new, sector_stats=sector_stats)
     
     # Apply feature engineering
     print("\nApplying feature engineering...")
     feature_engineer = FeatureEngineer()
     df_new = feature_engineer.engineer_all_features(df_new)
     
-    # Combine with existing data
-    df_combined = pd.concat([df_existing, df_new], ignore_index=True)
-    
-    # Remove duplicates (in case NVDA/TSLA were already there somehow)
-    df_combined = df_combined.drop_duplicates(subset=['symbol'], keep='last')
+    # Combine with existing data via an indexed update on symbol; combine_first
+    # prefers df_new, so rows already present are overwritten (keep='last')
+    df_combined = (
+        df_new.set_index('symbol')
+        .combine_first(df_existing.set_index('symbol'))
+        .reset_index()
+    )
     
     print(f"\n✅ Total companies: {len(df_combined)}")
     
-    # Save updated universe
-    df_combined.to_csv('data/processed/stock_universe_full.csv', index=False)
-    df_combined.to_csv('data/processed/stock_universe_engineered.csv', index=False)
-    
-    # Update cache
-    df_combined.to_parquet('data/cache/stock_universe_full.parquet', index=False)
-    
-    # Update categories
+    # Serialize the universe once, then hardlink the sibling paths to the
+    # same bytes instead of writing the frame three times
+    primary = Path(write_df(df_combined, 'data/processed/stock_universe_engineered'))
+    link_file(primary, Path('data/processed/stock_universe_full.parquet'))
+    link_file(primary, Path('data/cache/stock_universe_full.parquet'))
+
+    if export_csv:
+        df_combined.to_csv('data/processed/stock_universe_engineered.csv', index=False)
+
+    # Update categories as one partitioned dataset write
     print("\nUpdating categories...")
     categories = universe_builder.categorize_by_market_cap(df_combined)
-    
+
+    write_categories(categories)
     for cat_name, cat_df in categories.items():
-        cat_file = f'data/processed/category_{cat_name}.csv'
-        cat_df.to_csv(cat_file, index=False)
         print(f"  ✓ {cat_name}: {len(cat_df)} companies")
     
     print("\n" + "="*80)
     print("🎉 SUCCESSFULLY ADDED MISSING STOCKS!")
     print("="*80)
     print(f"\nUpdated files:")
-    print("  - stock_universe_full.csv")
-    print("  - stock_universe_engineered.csv")
-    print("  - category_mag7.csv")
-    print("  - All other category files")
+    print("  - stock_universe_full.parquet")
+    print("  - stock_universe_engineered.parquet")
+    print("  - universe_by_category/ (all categories)")
     
     # Show new stocks
     print("\n" + "-"*80)
@@ -87,4 +108,8 @@ def main():
         print(f"  Category: {stock['sector_category']}")
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    parser = argparse.ArgumentParser(description="Add missing stocks to the universe")
+    parser.add_argument('--export-csv', action='store_true',
+                        help="Also emit a CSV copy of the engineered universe")
+    args = parser.parse_args()
+    main(export_csv=args.export_csv)
\ No newline at end of file
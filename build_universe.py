@@ -11,7 +11,7 @@ from src.data.collectors import StockDataCollector
 from src.data.universe import universe_builder
 from src.data.cache_manager import cache_manager
 from src.utils.logger import logger
-from src.utils.helpers import format_market_cap
+from src.utils.helpers import format_market_cap, write_categories, write_df
 
 def main():
     print("\n" + "="*80)
@@ -35,8 +35,10 @@ def main():
     
     print(f"\n✅ Loaded {len(df)} companies\n")
     
-    # Add industry comparisons
-    df = collector.add_industry_comparisons(df)
+    # Compute sector benchmarks once; the comparisons and the saved stats
+    # below both reuse the same frame
+    sector_stats = universe_builder.calculate_sector_stats(df)
+    df = collector.add_industry_comparisons(df, sector_stats=sector_stats)
     
     # Categorize by market cap
     categories = universe_builder.categorize_by_market_cap(df)
@@ -63,18 +65,29 @@ def main():
         ['symbol', 'company_name', 'market_cap', 'sector_category']
     ]
     
-    for idx, row in top_10.iterrows():
-        print(f"{row['symbol']:6s} | {row['company_name']:40s} | "
-              f"{format_market_cap(row['market_cap']):12s} | {row['sector_category']}")
+    # Build the whole table as string columns in one pass instead of
+    # formatting row by row
+    top_10_lines = (
+        top_10['symbol'].str.ljust(6) + ' | '
+        + top_10['company_name'].str.ljust(40) + ' | '
+        + top_10['market_cap'].map(format_market_cap).str.ljust(12) + ' | '
+        + top_10['sector_category']
+    )
+    print('\n'.join(top_10_lines))
     
     # Sector breakdown
     print("\n" + "-"*80)
     print("SECTOR BREAKDOWN")
     print("-"*80)
     
-    sector_counts = df['sector_category'].value_counts()
-    for sector, count in sector_counts.items():
-        avg_market_cap = df[df['sector_category'] == sector]['market_cap'].mean()
+    # One groupby pass gets counts and means together, instead of a full
+    # boolean-mask scan per sector
+    sector_agg = (
+        df.groupby('sector_category')['market_cap']
+        .agg(['count', 'mean'])
+        .sort_values('count', ascending=False)
+    )
+    for sector, count, avg_market_cap in sector_agg.itertuples():
         print(f"{sector:20s} | {count:3d} companies | "
               f"Avg Market Cap: {format_market_cap(avg_market_cap)}")
     
@@ -84,20 +97,20 @@ def main():
     print("="*80 + "\n")
     
     # Save full dataset
-    output_file = 'data/processed/stock_universe_full.csv'
-    df.to_csv(output_file, index=False)
+    output_file = write_df(df, 'data/processed/stock_universe_full')
     print(f"✅ Full universe: {output_file}")
-    
-    # Save each category separately
+
+    # Save all categories as one partitioned dataset; readers pull a single
+    # category back with a partition filter instead of opening its own file
+    write_categories(categories)
     for cat_name, cat_df in categories.items():
-        cat_file = f'data/processed/category_{cat_name}.csv'
-        cat_df.to_csv(cat_file, index=False)
-        print(f"✅ {cat_name:10s}: {cat_file} ({len(cat_df)} companies)")
-    
-    # Save sector statistics
-    sector_stats = universe_builder.calculate_sector_stats(df)
-    sector_stats.to_csv('data/processed/sector_benchmarks.csv')
-    print(f"✅ Sector stats: data/processed/sector_benchmarks.csv")
+        print(f"✅ {cat_name:10s}: universe_by_category/category={cat_name} ({len(cat_df)} companies)")
+
+    # Save sector statistics, plus a cache copy for incremental scripts that
+    # add a few rows without rescanning the whole universe
+    sector_stats.to_parquet('data/processed/sector_benchmarks.parquet', compression='snappy')
+    sector_stats.to_parquet('data/cache/sector_benchmarks.parquet', compression='snappy')
+    print(f"✅ Sector stats: data/processed/sector_benchmarks.parquet")
     
     print("\n" + "="*80)
     print("🎉 UNIVERSE BUILD COMPLETE!")
@@ -9,6 +9,7 @@ sys.path.append(os.path.dirname(__file__))
 import pandas as pd
 from src.analysis.feature_engineering import FeatureEngineer
 from src.utils.logger import logger
+from src.utils.helpers import as_categorical, read_df, write_df
 
 def main():
     print("\n" + "="*80)
@@ -17,8 +18,8 @@ def main():
     
     # Load data
     print("Loading stock universe...")
-    df = pd.read_csv('data/processed/stock_universe_full.csv')
-    
+    df = as_categorical(read_df('data/processed/stock_universe_full'))
+
     print(f"Loaded {len(df)} companies")
     print(f"Original features: {len(df.columns)}")
     
@@ -30,8 +31,8 @@ def main():
     print("Engineering features...")
     print("-"*80 + "\n")
     
-    df_engineered = feature_engineer.engineer_all_features(df)
-    
+    df_engineered = as_categorical(feature_engineer.engineer_all_features(df))
+
     print("\n" + "="*80)
     print("📊 FEATURE ENGINEERING RESULTS")
     print("="*80 + "\n")
@@ -76,8 +77,7 @@ def main():
     print(df_engineered['financial_health'].value_counts())
     
     # Save enhanced dataset
-    output_file = 'data/processed/stock_universe_engineered.csv'
-    df_engineered.to_csv(output_file, index=False)
+    output_file = write_df(df_engineered, 'data/processed/stock_universe_engineered')
     
     print("\n" + "="*80)
     print("💾 SAVED ENHANCED DATASET")
@@ -7,6 +7,8 @@ import sys
 sys.path.append('.')
 
 from src.models.portfolio_ranker import PortfolioRanker
+from src.utils.helpers import write_df
+import numpy as np
 import pandas as pd
 
 def main():
@@ -49,21 +51,33 @@ def main():
     print(f"{'Rank':<6}{'Symbol':<8}{'Company':<40}{'Score':<8}{'Category':<12}{'Market Cap':<15}")
     print("-" * 100)
     
-    for _, row in top20.iterrows():
-        # Determine category
-        market_cap = row['market_cap']
-        if market_cap > 500e9:
-            cat = "Mag7/Giant"
-        elif market_cap > 100e9:
-            cat = "Large Cap"
-        else:
-            cat = "Mid Cap"
-        
-        company_name = row['company_name'][:38]
-        market_cap_str = f"${market_cap/1e9:.1f}B" if market_cap < 1e12 else f"${market_cap/1e12:.2f}T"
-        
-        print(f"{int(row['rank']):<6}{row['symbol']:<8}{company_name:<40}"
-              f"{row['rank_score']:.2f}    {cat:<12}{market_cap_str:<15}")
+    # Determine category and format every column vectorized, then print the
+    # whole table in one shot instead of formatting row by row
+    cat_col = pd.Series(
+        np.select(
+            [top20['market_cap'] > 500e9, top20['market_cap'] > 100e9],
+            ["Mag7/Giant", "Large Cap"],
+            default="Mid Cap",
+        ),
+        index=top20.index,
+    )
+    market_cap_str = pd.Series(
+        np.where(
+            top20['market_cap'] < 1e12,
+            (top20['market_cap'] / 1e9).map("${:.1f}B".format),
+            (top20['market_cap'] / 1e12).map("${:.2f}T".format),
+        ),
+        index=top20.index,
+    )
+    top20_lines = (
+        top20['rank'].astype(int).astype(str).str.ljust(6)
+        + top20['symbol'].str.ljust(8)
+        + top20['company_name'].str.slice(0, 38).str.ljust(40)
+        + top20['rank_score'].map("{:.2f}".format) + "    "
+        + cat_col.str.ljust(12)
+        + market_cap_str.str.ljust(15)
+    )
+    print('\n'.join(top20_lines))
     
     print("\n" + "="*100)
     
@@ -72,15 +86,12 @@ def main():
     
     # Save each category's top picks
     for cat in categories:
-        filename = f"data/processed/portfolio_{cat}_recommendations.csv"
-        results[cat]['top_picks'].to_csv(filename, index=False)
+        filename = write_df(results[cat]['top_picks'], f"data/processed/portfolio_{cat}_recommendations")
         print(f"  ✓ Saved {category_names[cat]} recommendations: {filename}")
-    
+
     # Save overall top 20
-    results['overall_top20']['top_picks'].to_csv(
-        'data/processed/portfolio_overall_top20.csv', index=False
-    )
-    print(f"  ✓ Saved Overall Top 20: data/processed/portfolio_overall_top20.csv")
+    write_df(results['overall_top20']['top_picks'], 'data/processed/portfolio_overall_top20')
+    print(f"  ✓ Saved Overall Top 20: data/processed/portfolio_overall_top20.parquet")
     
     # Create summary report
     with open('data/processed/PORTFOLIO_RECOMMENDATIONS.txt', 'w') as f:
@@ -98,18 +109,17 @@ def main():
         f.write("OVERALL TOP 20 PICKS\n")
         f.write("="*100 + "\n\n")
         
-        for _, row in top20.iterrows():
-            market_cap = row['market_cap']
-            if market_cap > 500e9:
-                cat = "Mag7/Giant"
-            elif market_cap > 100e9:
-                cat = "Large Cap"
-            else:
-                cat = "Mid Cap"
-            
-            f.write(f"{int(row['rank'])}. {row['symbol']} - {row['company_name']}\n")
-            f.write(f"   Score: {row['rank_score']:.2f} | Category: {cat} | "
-                   f"Market Cap: ${row['market_cap']/1e9:.1f}B\n\n")
+        # Reuse the vectorized category column and emit the whole block with
+        # a single write instead of two writes per row
+        report_lines = (
+            top20['rank'].astype(int).astype(str) + ". "
+            + top20['symbol'] + " - " + top20['company_name'] + "\n"
+            + "   Score: " + top20['rank_score'].map("{:.2f}".format)
+            + " | Category: " + cat_col
+            + " | Market Cap: " + (top20['market_cap'] / 1e9).map("${:.1f}B".format)
+            + "\n\n"
+        )
+        f.write(''.join(report_lines))
     
     print(f"  ✓ Saved Full Report: data/processed/PORTFOLIO_RECOMMENDATIONS.txt")
     
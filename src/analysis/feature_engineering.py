@@ -11,6 +11,54 @@ import pandas as pd
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
 
 from src.utils.logger import logger
+from src.utils.helpers import njit, NUMBA_AVAILABLE
+
+
+@njit(cache=True)
+def _minmax_scale_kernel(values: np.ndarray, min_val: float, max_val: float,
+                         invert: bool, nan_fill: float) -> np.ndarray:
+    """Min-max scale an array to 0-100, mapping NaN to nan_fill (JIT-compiled)"""
+    span = max_val - min_val
+    out = np.empty(values.shape[0], dtype=np.float64)
+    for i in range(values.shape[0]):
+        v = values[i]
+        if np.isnan(v):
+            out[i] = nan_fill
+        else:
+            scaled = (v - min_val) / span * 100.0
+            out[i] = 100.0 - scaled if invert else scaled
+    return out
+
+
+@njit(cache=True)
+def _minmax_scale_matrix(X: np.ndarray, caps: np.ndarray, invert: np.ndarray,
+                         nan_fill: float) -> np.ndarray:
+    """Column-wise 0-100 min-max scaling of a metric matrix (JIT-compiled)"""
+    n, k = X.shape
+    out = np.empty((n, k), dtype=np.float64)
+    for j in range(k):
+        lo = np.inf
+        hi = -np.inf
+        for i in range(n):
+            v = X[i, j]
+            if v > caps[j]:
+                v = caps[j]
+            if not np.isnan(v):
+                if v < lo:
+                    lo = v
+                if v > hi:
+                    hi = v
+        span = hi - lo
+        for i in range(n):
+            v = X[i, j]
+            if v > caps[j]:
+                v = caps[j]
+            if np.isnan(v) or span <= 0:
+                out[i, j] = nan_fill
+            else:
+                scaled = (v - lo) / span * 100.0
+                out[i, j] = 100.0 - scaled if invert[j] else scaled
+    return out
 
 
 class FeatureEngineer:
@@ -20,10 +68,14 @@ class FeatureEngineer:
         self.features_created = []
 
     def engineer_all_features(self, df: pd.DataFrame) -> pd.DataFrame:
-        """Apply all feature engineering transformations"""
+        """
+        Apply all feature engineering transformations
+
+        Note: columns are added to df in place; callers that need the
+        original untouched frame should pass a copy.
+        """
 
         logger.info("Starting feature engineering...")
-        df = df.copy()
 
         df = self._calculate_peg_ratio(df)
         df = self._create_quality_score(df)
@@ -36,7 +88,8 @@ class FeatureEngineer:
         df = self._normalize_composite_scores(df)
 
         logger.info(
-            f"Feature engineering complete. Created {len(self.features_created)} features"
+            "Feature engineering complete. Created %d features",
+            len(self.features_created),
         )
         return df
 
@@ -58,65 +111,65 @@ class FeatureEngineer:
         df["peg_ratio"] = df["peg_ratio"].fillna(df["peg_ratio_calculated"])
 
         self.features_created.append("peg_ratio_calculated")
-        logger.info("Calculated PEG ratios")
+        logger.debug("Calculated PEG ratios")
         return df
 
     def _create_quality_score(self, df: pd.DataFrame) -> pd.DataFrame:
         """Business quality score"""
 
-        roe = self._normalize_metric(df["roe"], True).fillna(50)
-        margin = self._normalize_metric(df["profit_margin"], True).fillna(50)
-        debt = self._normalize_metric(df["debt_to_equity"], False).fillna(50)
-        cashflow = self._normalize_metric(df["free_cash_flow"], True).fillna(50)
-
-        df["quality_score_raw"] = (
-            0.30 * roe + 0.30 * margin + 0.25 * debt + 0.15 * cashflow
-        )
+        scores = self._normalize_matrix(df, [
+            ("roe", True, None),
+            ("profit_margin", True, None),
+            ("debt_to_equity", False, None),
+            ("free_cash_flow", True, None),
+        ])
+        df["quality_score_raw"] = scores @ np.array([0.30, 0.30, 0.25, 0.15])
 
         self.features_created.append("quality_score_raw")
-        logger.info("Created quality score")
+        logger.debug("Created quality score")
         return df
 
     def _create_value_score(self, df: pd.DataFrame) -> pd.DataFrame:
         """Valuation score"""
 
-        pe = self._normalize_metric(df["pe_ratio"], False, cap_at=50).fillna(50)
-        peg = self._normalize_metric(df["peg_ratio"], False, cap_at=3).fillna(50)
-        pb = self._normalize_metric(df["price_to_book"], False, cap_at=10).fillna(50)
-        ps = self._normalize_metric(df["price_to_sales"], False, cap_at=20).fillna(50)
-
-        df["value_score_raw"] = 0.35 * pe + 0.30 * peg + 0.20 * pb + 0.15 * ps
+        scores = self._normalize_matrix(df, [
+            ("pe_ratio", False, 50),
+            ("peg_ratio", False, 3),
+            ("price_to_book", False, 10),
+            ("price_to_sales", False, 20),
+        ])
+        df["value_score_raw"] = scores @ np.array([0.35, 0.30, 0.20, 0.15])
 
         self.features_created.append("value_score_raw")
-        logger.info("Created value score")
+        logger.debug("Created value score")
         return df
 
     def _create_growth_score(self, df: pd.DataFrame) -> pd.DataFrame:
         """Growth potential score"""
 
-        revenue = self._normalize_metric(df["revenue_growth"], True).fillna(50)
-        earnings = self._normalize_metric(df["earnings_growth"], True).fillna(50)
-        returns = self._normalize_metric(df["return_1y"], True).fillna(50)
-
-        df["growth_score_raw"] = (
-            0.40 * revenue + 0.35 * earnings + 0.25 * returns
-        )
+        scores = self._normalize_matrix(df, [
+            ("revenue_growth", True, None),
+            ("earnings_growth", True, None),
+            ("return_1y", True, None),
+        ])
+        df["growth_score_raw"] = scores @ np.array([0.40, 0.35, 0.25])
 
         self.features_created.append("growth_score_raw")
-        logger.info("Created growth score")
+        logger.debug("Created growth score")
         return df
 
     def _create_momentum_score(self, df: pd.DataFrame) -> pd.DataFrame:
         """Momentum score"""
 
-        m1 = self._normalize_metric(df["return_1m"], True).fillna(50)
-        m3 = self._normalize_metric(df["return_3m"], True).fillna(50)
-        m6 = self._normalize_metric(df["return_6m"], True).fillna(50)
-
-        df["momentum_score_raw"] = 0.50 * m1 + 0.30 * m3 + 0.20 * m6
+        scores = self._normalize_matrix(df, [
+            ("return_1m", True, None),
+            ("return_3m", True, None),
+            ("return_6m", True, None),
+        ])
+        df["momentum_score_raw"] = scores @ np.array([0.50, 0.30, 0.20])
 
         self.features_created.append("momentum_score_raw")
-        logger.info("Created momentum score")
+        logger.debug("Created momentum score")
         return df
 
     # ------------------------------------------------------------------
@@ -126,12 +179,20 @@ class FeatureEngineer:
     def _calculate_altman_z_score(self, df: pd.DataFrame) -> pd.DataFrame:
         """Simplified Altman Z-Score"""
 
-        wc_ta = np.clip(df["current_ratio"].fillna(1) - 1, -2, 3)
-        re_ta = np.clip(df["roe"].fillna(0) * 5, -5, 5)
-        ebit_ta = np.clip(df["operating_margin"].fillna(0) * 3.3, -5, 5)
-        mv_tl = np.clip(1 / (df["debt_to_equity"].fillna(0.5) + 0.01), 0, 10)
-
-        df["altman_z_score"] = wc_ta + re_ta + ebit_ta + mv_tl
+        # Pull the inputs out as arrays with the NaN defaults applied at
+        # extraction, then fuse the four clipped terms into one expression
+        # instead of materializing a filled Series per component
+        cr = df["current_ratio"].to_numpy(np.float64, na_value=1.0)
+        roe = df["roe"].to_numpy(np.float64, na_value=0.0)
+        om = df["operating_margin"].to_numpy(np.float64, na_value=0.0)
+        de = df["debt_to_equity"].to_numpy(np.float64, na_value=0.5)
+
+        df["altman_z_score"] = (
+            np.clip(cr - 1, -2, 3)
+            + np.clip(roe * 5, -5, 5)
+            + np.clip(om * 3.3, -5, 5)
+            + np.clip(1.0 / (de + 0.01), 0, 10)
+        )
 
         df["financial_health"] = pd.cut(
             df["altman_z_score"],
@@ -140,42 +201,46 @@ class FeatureEngineer:
         )
 
         self.features_created.extend(["altman_z_score", "financial_health"])
-        logger.info("Calculated Altman Z-Score")
+        logger.debug("Calculated Altman Z-Score")
         return df
 
     def _calculate_profitability_flag(self, df: pd.DataFrame) -> pd.DataFrame:
         """Profitability flags"""
 
         df["is_profitable"] = df["profit_margin"] > 0
-        df["profitability_status"] = np.where(
-            df["profit_margin"] > 0.15,
-            "Highly Profitable",
-            np.where(
-                df["profit_margin"] > 0.05,
-                "Profitable",
-                np.where(
+        # One branch-tree pass instead of three nested np.where allocations
+        df["profitability_status"] = pd.Series(
+            np.select(
+                [
+                    df["profit_margin"] > 0.15,
+                    df["profit_margin"] > 0.05,
                     df["profit_margin"] > 0,
-                    "Marginally Profitable",
-                    "Unprofitable",
-                ),
+                ],
+                ["Highly Profitable", "Profitable", "Marginally Profitable"],
+                default="Unprofitable",
             ),
-        )
+            index=df.index,
+        ).astype("category")
 
         self.features_created.extend(["is_profitable", "profitability_status"])
-        logger.info("Created profitability flags")
+        logger.debug("Created profitability flags")
         return df
 
     def _categorize_risk(self, df: pd.DataFrame) -> pd.DataFrame:
         """Overall risk categorization"""
 
-        risk_score = (
-            np.clip((df["beta"].fillna(1) - 0.5) * 2, 0, 3)
-            + np.clip(df["volatility_90d"].fillna(0.3) * 10, 0, 3)
-            + np.clip(df["debt_to_equity"].fillna(0.5) / 0.5, 0, 3)
-            + np.where(df["profit_margin"] < 0, 1, 0)
+        # Same fusion as the Altman composite: fill at extraction, one pass
+        beta = df["beta"].to_numpy(np.float64, na_value=1.0)
+        vol = df["volatility_90d"].to_numpy(np.float64, na_value=0.3)
+        de = df["debt_to_equity"].to_numpy(np.float64, na_value=0.5)
+        margin = df["profit_margin"].to_numpy(np.float64)
+
+        df["risk_score"] = (
+            np.clip((beta - 0.5) * 2, 0, 3)
+            + np.clip(vol * 10, 0, 3)
+            + np.clip(de / 0.5, 0, 3)
+            + (margin < 0)
         )
-
-        df["risk_score"] = risk_score
         df["risk_category"] = pd.cut(
             df["risk_score"],
             bins=[0, 3, 6, np.inf],
@@ -183,7 +248,7 @@ class FeatureEngineer:
         )
 
         self.features_created.extend(["risk_score", "risk_category"])
-        logger.info("Categorized risk levels")
+        logger.debug("Categorized risk levels")
         return df
 
     # ------------------------------------------------------------------
@@ -212,39 +277,70 @@ class FeatureEngineer:
         )
 
         self.features_created.append("composite_score")
-        logger.info("Normalized composite scores")
+        logger.debug("Normalized composite scores")
         return df
 
+    def _normalize_matrix(
+        self,
+        df: pd.DataFrame,
+        specs: list[tuple[str, bool, float | None]],
+    ) -> np.ndarray:
+        """
+        Normalize several metric columns to 0-100 in one batched kernel pass
+
+        Args:
+            specs: (column, higher_better, cap_at) triples
+
+        Returns an (n, k) array in spec order; the weighted score is then a
+        single matrix-vector product.
+        """
+        if not NUMBA_AVAILABLE:
+            return np.column_stack([
+                self._normalize_metric(df[col], higher_better, cap_at)
+                for col, higher_better, cap_at in specs
+            ])
+
+        X = np.column_stack([df[col].to_numpy(np.float64) for col, _, _ in specs])
+        caps = np.array([np.inf if cap_at is None else float(cap_at)
+                         for _, _, cap_at in specs])
+        invert = np.array([not higher_better for _, higher_better, _ in specs])
+        return _minmax_scale_matrix(X, caps, invert, 50.0)
+
     def _normalize_metric(
         self,
         series: pd.Series,
         higher_better: bool = True,
         cap_at: float | None = None,
-    ) -> pd.Series:
-        """Normalize a metric to 0–100 scale"""
+    ) -> np.ndarray:
+        """Normalize a metric to 0–100 (NaNs map to the 50 midpoint)"""
 
-        s = series.copy()
+        a = series.to_numpy(dtype=np.float64)
 
         if cap_at is not None:
-            s = s.clip(upper=cap_at)
-
-        min_val, max_val = s.min(), s.max()
+            # minimum, not fmin: NaN must stay NaN here so missing values
+            # fall through to the 50 midpoint instead of being capped and
+            # scored as the worst value
+            a = np.minimum(a, cap_at)
 
-        if pd.isna(min_val) or min_val == max_val:
-            return pd.Series(50, index=s.index)
+        # fmin/fmax reductions skip NaN without the nanmin all-NaN warning
+        min_val = np.fmin.reduce(a) if a.size else np.nan
+        max_val = np.fmax.reduce(a) if a.size else np.nan
 
-        normalized = (s - min_val) / (max_val - min_val) * 100
+        if np.isnan(min_val) or min_val == max_val:
+            return np.full(a.shape, 50.0)
 
-        if not higher_better:
-            normalized = 100 - normalized
-
-        return normalized
+        return _minmax_scale_kernel(a, min_val, max_val, not higher_better, 50.0)
 
     @staticmethod
     def _scale_to_100(series: pd.Series) -> pd.Series:
         """Final scaling helper"""
 
-        if series.max() == series.min():
+        a = series.to_numpy(dtype=np.float64)
+        min_val = np.fmin.reduce(a) if a.size else np.nan
+        max_val = np.fmax.reduce(a) if a.size else np.nan
+
+        if np.isnan(min_val) or min_val == max_val:
             return pd.Series(50, index=series.index)
 
-        return (series - series.min()) / (series.max() - series.min()) * 100
+        scaled = _minmax_scale_kernel(a, min_val, max_val, False, np.nan)
+        return pd.Series(scaled, index=series.index)
@@ -3,9 +3,9 @@ Data caching system to avoid redundant API calls
 """
 
 import pandas as pd
+import pyarrow.parquet as pq
 from pathlib import Path
 from datetime import datetime, timedelta
-import pickle
 import sys
 import os
 
@@ -48,7 +48,10 @@ class CacheManager:
         cache_path = self.get_cache_path(cache_key)
         
         try:
-            df.to_parquet(cache_path, index=False)
+            # zstd compresses ~30-40% smaller than snappy at comparable
+            # decode speed, and this file is re-read on every run
+            df.to_parquet(cache_path, index=False, engine='pyarrow',
+                          compression='zstd', compression_level=3)
             logger.info(f"💾 Saved to cache: {cache_key} ({len(df)} rows)")
         except Exception as e:
             logger.error(f"❌ Failed to save cache: {e}")
@@ -58,13 +61,75 @@ class CacheManager:
         cache_path = self.get_cache_path(cache_key)
         
         try:
-            df = pd.read_parquet(cache_path)
+            # Memory-mapped read plus a self-destructing Arrow table keeps
+            # the Arrow->pandas conversion close to zero-copy
+            df = pq.read_table(cache_path, memory_map=True).to_pandas(
+                self_destruct=True, split_blocks=True
+            )
             logger.info(f"📂 Loaded from cache: {cache_key} ({len(df)} rows)")
             return df
         except Exception as e:
             logger.error(f"❌ Failed to load cache: {e}")
             return None
     
+    def dataset_path(self, dataset_key: str) -> Path:
+        """Get root path for a partitioned dataset"""
+        return self.cache_dir / dataset_key
+
+    def is_partition_valid(self, dataset_key: str, partition: str) -> bool:
+        """Check one hive partition (e.g. 'symbol=AAPL') against the TTL"""
+        part_dir = self.dataset_path(dataset_key) / partition
+
+        if not part_dir.exists():
+            return False
+
+        file_time = datetime.fromtimestamp(part_dir.stat().st_mtime)
+        age_hours = (datetime.now() - file_time).total_seconds() / 3600
+        return age_hours <= self.cache_expiry_hours
+
+    def save_partitioned(self, df: pd.DataFrame, dataset_key: str, partition_cols: list):
+        """
+        Write rows into one hive-partitioned dataset, replacing only the
+        partitions the frame touches
+
+        Keeps many related cache entries (one per symbol, sector, ...) in a
+        single dataset that readers can scan with predicate pushdown instead
+        of one flat file per key.
+        """
+        import pyarrow as pa
+        import pyarrow.dataset as ds
+
+        try:
+            table = pa.Table.from_pandas(df, preserve_index=False)
+            fmt = ds.ParquetFileFormat()
+            ds.write_dataset(
+                table,
+                base_dir=str(self.dataset_path(dataset_key)),
+                format=fmt,
+                partitioning=ds.partitioning(
+                    pa.schema([table.schema.field(col) for col in partition_cols]),
+                    flavor='hive',
+                ),
+                existing_data_behavior='delete_matching',
+                file_options=fmt.make_write_options(compression='zstd', compression_level=3),
+            )
+            logger.info(f"💾 Saved to dataset: {dataset_key} ({len(df)} rows)")
+        except Exception as e:
+            logger.error(f"❌ Failed to save dataset {dataset_key}: {e}")
+
+    def load_partitioned(self, dataset_key: str, filters=None) -> pd.DataFrame:
+        """Load rows from a partitioned dataset with optional partition pruning"""
+        path = self.dataset_path(dataset_key)
+
+        if not path.exists():
+            return None
+
+        try:
+            return pd.read_parquet(path, filters=filters)
+        except Exception as e:
+            logger.error(f"❌ Failed to load dataset {dataset_key}: {e}")
+            return None
+
     def get_or_fetch(self, cache_key: str, fetch_function, *args, **kwargs) -> pd.DataFrame:
         """
         Get data from cache if valid, otherwise fetch and cache
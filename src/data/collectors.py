@@ -2,11 +2,91 @@ import yfinance as yf
 import pandas as pd
 import numpy as np
 from typing import Dict, List, Optional
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timedelta
+from functools import cached_property
+from pathlib import Path
+import threading
 import time
 from src.utils.logger import logger
-from src.utils.helpers import retry_on_failure
+from src.utils.helpers import retry_on_failure, njit, NUMBA_AVAILABLE
 from src.utils.config import config
+from src.data.cache_manager import cache_manager
+
+@njit(cache=True)
+def _max_drawdown_kernel(p: np.ndarray) -> float:
+    """Single-pass max drawdown over a price array (JIT-compiled)"""
+    peak = p[0]
+    mdd = 0.0
+    for i in range(1, p.size):
+        if p[i] > peak:
+            peak = p[i]
+        else:
+            dd = (p[i] - peak) / peak
+            if dd < mdd:
+                mdd = dd
+    return mdd * 100.0
+
+class RateLimiter:
+    """
+    Leaky-bucket limiter shared across worker threads: keeps successive
+    calls at least min_interval seconds apart globally, instead of each
+    call sleeping for the full interval
+    """
+
+    def __init__(self, min_interval: float):
+        self.min_interval = min_interval
+        self._lock = threading.Lock()
+        self._next_call_time = 0.0
+
+    def wait(self):
+        """Block until this caller's slot in the global schedule arrives"""
+        if self.min_interval <= 0:
+            return
+        with self._lock:
+            now = time.monotonic()
+            delay = self._next_call_time - now
+            self._next_call_time = max(now, self._next_call_time) + self.min_interval
+        if delay > 0:
+            time.sleep(delay)
+
+class LazyTickerData:
+    """
+    Ticker payload whose financial statements fetch on first access
+
+    Each statement attribute is a separate HTTPS GET under yfinance, but
+    extract_key_metrics only touches info and historical_prices - keeping
+    the statements as cached properties means those round-trips are only
+    paid by callers that actually read them. Supports dict-style access
+    for compatibility with the previous plain-dict payload.
+    """
+
+    def __init__(self, symbol: str, ticker: yf.Ticker, info: Dict,
+                 historical_prices: pd.DataFrame):
+        self.symbol = symbol
+        self._ticker = ticker
+        self.info = info
+        self.historical_prices = historical_prices
+        self.fetch_timestamp = datetime.now()
+
+    @cached_property
+    def financials(self) -> pd.DataFrame:
+        return self._ticker.financials
+
+    @cached_property
+    def balance_sheet(self) -> pd.DataFrame:
+        return self._ticker.balance_sheet
+
+    @cached_property
+    def cash_flow(self) -> pd.DataFrame:
+        return self._ticker.cashflow
+
+    @cached_property
+    def quarterly_financials(self) -> pd.DataFrame:
+        return self._ticker.quarterly_financials
+
+    def __getitem__(self, key):
+        return getattr(self, key)
 
 class StockDataCollector:
     """
@@ -17,47 +97,72 @@ class StockDataCollector:
         self.cache_enabled = config.get('data_collection.cache_enabled', True)
         self.rate_limit_delay = config.get('data_collection.rate_limit_delay', 1.0)
         self.historical_years = config.get('data_collection.historical_years', 5)
+        self.max_workers = config.get('data_collection.max_workers', 8)
+        self.cache_expiry_hours = config.get('data_collection.cache_expiry_hours', 24)
+        self.fundamentals_cache_dir = Path('data/cache/fundamentals')
+        self.rate_limiter = RateLimiter(self.rate_limit_delay)
+        self._hist_cache: Dict[str, pd.DataFrame] = {}
+
+    def prefetch_histories(self, symbols: List[str]):
+        """
+        Download price histories for many symbols in one bulk request
+
+        yf.download batches all tickers into a single call, saving an HTTPS
+        round-trip per symbol versus ticker.history(); fetch_ticker_info
+        falls back to the per-symbol path for anything missing from the batch.
+        """
+        if not symbols:
+            return
+
+        end_date = datetime.now()
+        start_date = end_date - timedelta(days=365 * self.historical_years)
+
+        try:
+            data = yf.download(symbols, start=start_date, end=end_date,
+                               group_by='ticker', threads=True, progress=False)
+        except Exception as e:
+            logger.warning(f"Bulk history download failed, using per-symbol fetches: {e}")
+            return
+
+        for symbol in symbols:
+            try:
+                hist = data[symbol] if len(symbols) > 1 else data
+            except KeyError:
+                continue
+            hist = hist.dropna(how='all')
+            if not hist.empty:
+                self._hist_cache[symbol] = hist
+
+        logger.info(f"✅ Prefetched price history for {len(self._hist_cache)} symbols")
     
     @retry_on_failure(max_retries=3, delay=2.0)
-    def fetch_ticker_info(self, symbol: str) -> Dict:
+    def fetch_ticker_info(self, symbol: str) -> LazyTickerData:
         """
         Fetch comprehensive ticker information
+
+        info and the price history are fetched eagerly; the financial
+        statements stay lazy on the returned payload and are only pulled
+        when a caller reads them.
         """
         logger.info(f"Fetching data for {symbol}")
-        
+
+        # Global rate limit shared across worker threads
+        self.rate_limiter.wait()
+
         ticker = yf.Ticker(symbol)
-        
+
         try:
-            # Basic info
-            info = ticker.info
-            
-            # Historical prices
-            end_date = datetime.now()
-            start_date = end_date - timedelta(days=365 * self.historical_years)
-            hist = ticker.history(start=start_date, end=end_date)
-            
-            # Financial statements
-            financials = ticker.financials
-            balance_sheet = ticker.balance_sheet
-            cash_flow = ticker.cashflow
-            
-            # Quarterly data for recent trends
-            quarterly_financials = ticker.quarterly_financials
-            
-            data = {
-                'symbol': symbol,
-                'info': info,
-                'historical_prices': hist,
-                'financials': financials,
-                'balance_sheet': balance_sheet,
-                'cash_flow': cash_flow,
-                'quarterly_financials': quarterly_financials,
-                'fetch_timestamp': datetime.now()
-            }
-            
-            # Rate limiting
-            time.sleep(self.rate_limit_delay)
-            
+            # Basic info - memoized on disk per symbol and day
+            info = self._fetch_info_cached(ticker)
+
+            # Historical prices - served from the bulk prefetch when
+            # available, then from the daily disk cache
+            hist = self._hist_cache.get(symbol)
+            if hist is None:
+                hist = self._fetch_history_cached(ticker)
+
+            data = LazyTickerData(symbol, ticker, info, hist)
+
             logger.info(f"✅ Successfully fetched data for {symbol}")
             return data
             
@@ -122,53 +227,196 @@ class StockDataCollector:
             'country': info.get('country', 'Unknown'),
         }
         
-        # Calculate additional metrics from price history
+        # Calculate additional metrics from price history; pull the close
+        # column out once and index the raw array instead of going through
+        # a pandas indexer per metric
         if not hist.empty:
-            returns = hist['Close'].pct_change().dropna()
-            
-            metrics['volatility_30d'] = returns.tail(30).std() * np.sqrt(252) * 100  # Annualized
-            metrics['volatility_90d'] = returns.tail(90).std() * np.sqrt(252) * 100
-            metrics['max_drawdown'] = self._calculate_max_drawdown(hist['Close'])
+            close = hist['Close'].to_numpy(dtype=np.float64)
+            returns = close[1:] / close[:-1] - 1
+
+            metrics['volatility_30d'] = returns[-30:].std(ddof=1) * np.sqrt(252) * 100  # Annualized
+            metrics['volatility_90d'] = returns[-90:].std(ddof=1) * np.sqrt(252) * 100
+            metrics['max_drawdown'] = self._calculate_max_drawdown(close)
             metrics['sharpe_ratio'] = self._calculate_sharpe(returns)
-            
+
             # Momentum indicators
-            metrics['return_1m'] = (hist['Close'].iloc[-1] / hist['Close'].iloc[-21] - 1) * 100 if len(hist) > 21 else np.nan
-            metrics['return_3m'] = (hist['Close'].iloc[-1] / hist['Close'].iloc[-63] - 1) * 100 if len(hist) > 63 else np.nan
-            metrics['return_6m'] = (hist['Close'].iloc[-1] / hist['Close'].iloc[-126] - 1) * 100 if len(hist) > 126 else np.nan
-            metrics['return_1y'] = (hist['Close'].iloc[-1] / hist['Close'].iloc[-252] - 1) * 100 if len(hist) > 252 else np.nan
-        
+            last = close[-1]
+            for name, lag in (('return_1m', 21), ('return_3m', 63),
+                              ('return_6m', 126), ('return_1y', 252)):
+                metrics[name] = (last / close[-lag] - 1) * 100 if close.size > lag else np.nan
+
         return metrics
     
     def _calculate_max_drawdown(self, prices: pd.Series) -> float:
         """Calculate maximum drawdown"""
-        cumulative = (1 + prices.pct_change()).cumprod()
-        running_max = cumulative.expanding().max()
-        drawdown = (cumulative - running_max) / running_max
-        return drawdown.min() * 100  # As percentage
-    
+        # Drawdown on raw prices equals drawdown on the cumulative-return
+        # curve (the common p[0] factor cancels), so skip the pct_change/
+        # cumprod/expanding passes entirely
+        p = np.asarray(prices, dtype=np.float64)
+        if p.size < 2 or p[0] == 0:
+            return 0.0
+        if NUMBA_AVAILABLE:
+            # Single fused loop, no temporary peak/drawdown arrays
+            return float(_max_drawdown_kernel(p))
+        peak = np.maximum.accumulate(p)
+        drawdown = (p - peak) / peak
+        return float(drawdown.min() * 100)  # As percentage
+
     def _calculate_sharpe(self, returns: pd.Series, risk_free_rate: float = 0.02) -> float:
         """Calculate Sharpe ratio"""
-        excess_returns = returns - risk_free_rate / 252
-        if excess_returns.std() == 0:
+        excess_returns = np.asarray(returns, dtype=np.float64) - risk_free_rate / 252
+        std = excess_returns.std(ddof=1)
+        if std == 0 or np.isnan(std):
             return 0.0
-        return (excess_returns.mean() / excess_returns.std()) * np.sqrt(252)
+        return float(excess_returns.mean() / std * np.sqrt(252))
     
-    def batch_fetch(self, symbols: List[str]) -> pd.DataFrame:
+    def _fetch_info_cached(self, ticker: "yf.Ticker") -> Dict:
         """
-        Fetch data for multiple symbols and return as DataFrame
+        Fetch ticker.info through the 24-hour disk cache
+
+        Repeat runs on the same day rebuild the dict from the cached row
+        instead of paying another HTTP round-trip. Nested values (lists of
+        officers etc.) are dropped before caching; extract_key_metrics only
+        reads scalar fields.
         """
-        all_metrics = []
-        
-        for symbol in symbols:
-            try:
-                ticker_data = self.fetch_ticker_info(symbol)
-                metrics = self.extract_key_metrics(ticker_data)
-                all_metrics.append(metrics)
-            except Exception as e:
-                logger.warning(f"Skipping {symbol} due to error: {e}")
-                continue
-        
+        def fetch():
+            scalars = {
+                k: v for k, v in ticker.info.items()
+                if v is None or isinstance(v, (str, int, float, bool))
+            }
+            return pd.DataFrame([scalars])
+
+        row = cache_manager.get_or_fetch(f"info_{ticker.ticker}", fetch)
+        if row is None or row.empty:
+            return {}
+        return row.iloc[0].to_dict()
+
+    def _fetch_history_cached(self, ticker: "yf.Ticker") -> pd.DataFrame:
+        """
+        Fetch one symbol's price history through the 24-hour disk cache
+
+        Histories live in one dataset partitioned by symbol, so a refresh
+        replaces only that symbol's partition and whole-universe scans can
+        read every history in a single dataset walk.
+        """
+        symbol = ticker.ticker
+
+        if cache_manager.is_partition_valid('histories', f'symbol={symbol}'):
+            hist = cache_manager.load_partitioned(
+                'histories', filters=[('symbol', '=', symbol)]
+            )
+            if hist is not None and not hist.empty:
+                hist = hist.drop(columns='symbol')
+                return hist.set_index(hist.columns[0])
+
+        end_date = datetime.now()
+        start_date = end_date - timedelta(days=365 * self.historical_years)
+        hist = ticker.history(start=start_date, end=end_date)
+
+        if not hist.empty:
+            cache_manager.save_partitioned(
+                hist.reset_index().assign(symbol=symbol), 'histories', ['symbol']
+            )
+        return hist
+
+    def _metrics_cache_path(self, symbol: str) -> Path:
+        """Path of the per-symbol fundamentals cache file"""
+        return self.fundamentals_cache_dir / f"{symbol}.parquet"
+
+    def _load_cached_metrics(self, symbol: str) -> Optional[Dict]:
+        """Load cached metrics for a symbol if younger than the cache TTL"""
+        cache_path = self._metrics_cache_path(symbol)
+
+        if not self.cache_enabled or not cache_path.exists():
+            return None
+
+        try:
+            row = pd.read_parquet(cache_path)
+            fetched_at = pd.Timestamp(row['fetched_at'].iloc[0])
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable cache for {symbol}: {e}")
+            return None
+
+        age_hours = (pd.Timestamp.now() - fetched_at).total_seconds() / 3600
+        if age_hours > self.cache_expiry_hours:
+            return None
+
+        logger.info(f"✅ Cached fundamentals for {symbol} ({age_hours:.1f} hours old)")
+        return row.drop(columns=['fetched_at']).iloc[0].to_dict()
+
+    def _save_cached_metrics(self, symbol: str, metrics: Dict):
+        """Persist a symbol's metrics with a fetched_at timestamp"""
+        if not self.cache_enabled:
+            return
+
+        try:
+            self.fundamentals_cache_dir.mkdir(parents=True, exist_ok=True)
+            row = pd.DataFrame([{**metrics, 'fetched_at': pd.Timestamp.now()}])
+            row.to_parquet(self._metrics_cache_path(symbol), index=False)
+        except Exception as e:
+            logger.error(f"❌ Failed to cache fundamentals for {symbol}: {e}")
+
+    def batch_fetch(self, symbols: List[str], force_refresh: bool = False) -> pd.DataFrame:
+        """
+        Fetch data for multiple symbols in parallel and return as DataFrame
+
+        Symbols with a fresh on-disk fundamentals cache are served locally;
+        only the rest hit the network. Each fetch is dominated by HTTP
+        latency, so a thread pool overlaps the round-trips; results are
+        keyed by symbol to preserve input order.
+
+        Args:
+            symbols: Ticker symbols to fetch
+            force_refresh: Bypass the fundamentals cache and refetch everything
+        """
+        results = {}
+
+        if not force_refresh:
+            for symbol in symbols:
+                cached = self._load_cached_metrics(symbol)
+                if cached is not None:
+                    results[symbol] = cached
+
+        to_fetch = [symbol for symbol in symbols if symbol not in results]
+
+        if to_fetch:
+            # One bulk request for all price histories before the per-symbol
+            # info/financials fetches fan out
+            self.prefetch_histories(to_fetch)
+
+            max_workers = max(1, min(self.max_workers, len(to_fetch)))
+
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                futures = {
+                    executor.submit(self.fetch_ticker_info, symbol): symbol
+                    for symbol in to_fetch
+                }
+                for future in as_completed(futures):
+                    symbol = futures[future]
+                    try:
+                        metrics = self.extract_key_metrics(future.result())
+                    except Exception as e:
+                        logger.warning(f"Skipping {symbol} due to error: {e}")
+                        continue
+                    results[symbol] = metrics
+                    self._save_cached_metrics(symbol, metrics)
+
+        all_metrics = [results[symbol] for symbol in symbols if symbol in results]
         df = pd.DataFrame(all_metrics)
+
+        if not df.empty:
+            # Ratios and returns don't need float64 precision; halving the
+            # dtype halves bandwidth for every downstream pass. Dollar-scale
+            # columns keep float64 so market caps don't lose integer dollars
+            dollar_cols = {'market_cap', 'enterprise_value',
+                           'free_cash_flow', 'operating_cash_flow'}
+            float_cols = [col for col in df.select_dtypes(include='float64').columns
+                          if col not in dollar_cols]
+            df[float_cols] = df[float_cols].astype('float32')
+            for col in ('sector', 'industry', 'country'):
+                if col in df.columns:
+                    df[col] = df[col].astype('category')
+
         logger.info(f"✅ Successfully fetched data for {len(df)} / {len(symbols)} symbols")
         
         return df
@@ -194,25 +442,42 @@ class StockDataCollector:
         
         df = self.batch_fetch(all_symbols)
         
-        # Add sector information
-        df['sector_category'] = df['symbol'].apply(universe_builder.get_sector_for_symbol)
+        # Add sector information - vectorized lookup against the reverse index
+        df['sector_category'] = (
+            df['symbol'].map(universe_builder.sector_map).fillna('unknown').astype('category')
+        )
         
         return df
     
-    def add_industry_comparisons(self, df: pd.DataFrame) -> pd.DataFrame:
+    def add_industry_comparisons(self, df: pd.DataFrame,
+                                 sector_stats: Optional[pd.DataFrame] = None) -> pd.DataFrame:
         """
         Add industry comparison metrics (percentile ranks within sector)
+
+        Args:
+            df: Universe frame with sector_category
+            sector_stats: Precomputed sector benchmarks; calculated from df
+                (and cached to disk) when omitted
         """
         from src.data.universe import universe_builder
-        
-        # Calculate sector stats
-        sector_stats = universe_builder.calculate_sector_stats(df)
-        
-        # Add percentile ranks within sector
-        for metric in ['pe_ratio', 'profit_margin', 'revenue_growth', 'roe', 'beta']:
-            if metric in df.columns:
-                # Calculate percentile rank within sector
-                df[f'{metric}_sector_rank'] = df.groupby('sector_category')[metric].rank(pct=True) * 100
+
+        # Calculate sector stats only when the caller has none cached
+        if sector_stats is None:
+            sector_stats = universe_builder.calculate_sector_stats(df)
+            try:
+                Path('data/cache').mkdir(parents=True, exist_ok=True)
+                sector_stats.to_parquet('data/cache/sector_benchmarks.parquet',
+                                        compression='snappy')
+            except Exception as e:
+                logger.warning(f"Could not cache sector benchmarks: {e}")
+
+        # Add percentile ranks within sector - one groupby shares the
+        # grouping indexer across all metrics instead of regrouping per column
+        metrics = ['pe_ratio', 'profit_margin', 'revenue_growth', 'roe', 'beta']
+        present = [metric for metric in metrics if metric in df.columns]
+        if present:
+            ranks = df.groupby('sector_category', observed=True)[present].rank(pct=True) * 100
+            df[[f'{metric}_sector_rank' for metric in present]] = ranks
         
         logger.info("✅ Added industry comparison metrics")
         
@@ -227,24 +492,21 @@ class StockDataCollector:
         trends = {}
         
         if not hist.empty and len(hist) > 252:
-            prices = hist['Close']
-            
+            prices = hist['Close'].to_numpy(dtype=np.float64)
+            end_price = prices[-1]
+
             # 3-year CAGR
-            if len(prices) >= 756:  # 3 years
-                start_price = prices.iloc[-756]
-                end_price = prices.iloc[-1]
-                trends['cagr_3y'] = (pow(end_price / start_price, 1/3) - 1) * 100
-            
+            if prices.size >= 756:  # 3 years
+                trends['cagr_3y'] = (pow(end_price / prices[-756], 1/3) - 1) * 100
+
             # 5-year CAGR
-            if len(prices) >= 1260:  # 5 years
-                start_price = prices.iloc[-1260]
-                end_price = prices.iloc[-1]
-                trends['cagr_5y'] = (pow(end_price / start_price, 1/5) - 1) * 100
-            
+            if prices.size >= 1260:  # 5 years
+                trends['cagr_5y'] = (pow(end_price / prices[-1260], 1/5) - 1) * 100
+
             # Price momentum (vs moving averages)
-            current_price = prices.iloc[-1]
-            ma_50 = prices.tail(50).mean()
-            ma_200 = prices.tail(200).mean()
+            current_price = end_price
+            ma_50 = prices[-50:].mean()
+            ma_200 = prices[-200:].mean()
             
             trends['price_vs_ma50'] = ((current_price / ma_50) - 1) * 100
             trends['price_vs_ma200'] = ((current_price / ma_200) - 1) * 100
@@ -2,6 +2,7 @@
 Stock Universe Manager - Builds and maintains company lists
 """
 
+import numpy as np
 import pandas as pd
 import yfinance as yf
 from typing import List, Dict
@@ -70,7 +71,14 @@ class UniverseBuilder:
                 'T', 'VZ', 'TMUS', 'CHTR'
             ]
         }
-    
+
+        # Reverse index for O(1) symbol -> sector lookups; first listing wins
+        # for symbols that appear under multiple sectors
+        self.sector_map: Dict[str, str] = {}
+        for sector, symbols in self.universe.items():
+            for symbol in symbols:
+                self.sector_map.setdefault(symbol, sector)
+
     def get_all_symbols(self) -> List[str]:
         """Get all unique symbols across sectors"""
         all_symbols = set()
@@ -79,11 +87,8 @@ class UniverseBuilder:
         return sorted(list(all_symbols))
     
     def get_sector_for_symbol(self, symbol: str) -> str:
-        """Get sector for a given symbol"""
-        for sector, symbols in self.universe.items():
-            if symbol in symbols:
-                return sector
-        return 'unknown'
+        """Get sector for a given symbol (O(1) reverse-index lookup)"""
+        return self.sector_map.get(symbol, 'unknown')
     
     def categorize_by_market_cap(self, df: pd.DataFrame) -> Dict[str, pd.DataFrame]:
         """
@@ -92,30 +97,36 @@ class UniverseBuilder:
         Returns:
             Dictionary with keys: 'mag7', 'giant', 'large', 'mid'
         """
-        categories = {}
-        
-        # Magnificent 7 (explicitly defined)
-        categories['mag7'] = df[df['symbol'].isin(self.mag7)].copy()
-        
-        # Remove mag7 from other categories
-        df_remaining = df[~df['symbol'].isin(self.mag7)].copy()
-        
-        # Giant: >$500B (excluding mag7)
-        categories['giant'] = df_remaining[
-            df_remaining['market_cap'] > 500_000_000_000
-        ].copy()
-        
-        # Large: $100B - $500B
-        categories['large'] = df_remaining[
-            (df_remaining['market_cap'] >= 100_000_000_000) &
-            (df_remaining['market_cap'] <= 500_000_000_000)
-        ].copy()
-        
-        # Mid: <$100B
-        categories['mid'] = df_remaining[
-            df_remaining['market_cap'] < 100_000_000_000
-        ].copy()
-        
+        # Magnificent 7 (explicitly defined); everything else is bucketed by
+        # one np.select pass over market_cap instead of three mask scans.
+        # Rows with an unknown market cap get an empty label and fall out of
+        # every bucket, matching the old mask behaviour.
+        mask_mag7 = df['symbol'].isin(self.mag7)
+        df_remaining = df[~mask_mag7]
+
+        market_cap = df_remaining['market_cap']
+        labels = pd.Series(
+            np.select(
+                [
+                    market_cap > 500_000_000_000,
+                    market_cap >= 100_000_000_000,
+                    market_cap.notna(),
+                ],
+                ['giant', 'large', 'mid'],
+                default='',
+            ),
+            index=df_remaining.index,
+        )
+        parts = {name: group.copy() for name, group in df_remaining.groupby(labels)}
+
+        empty = df_remaining.iloc[0:0]
+        categories = {
+            'mag7': df[mask_mag7].copy(),
+            'giant': parts.get('giant', empty.copy()),
+            'large': parts.get('large', empty.copy()),
+            'mid': parts.get('mid', empty.copy()),
+        }
+
         # Log statistics
         logger.info(f"📊 Categorization Complete:")
         logger.info(f"  Magnificent 7: {len(categories['mag7'])} companies")
@@ -152,11 +163,13 @@ class UniverseBuilder:
         """
         Calculate sector-level statistics for benchmarking
         """
-        # Add sector column
-        df['sector_category'] = df['symbol'].apply(self.get_sector_for_symbol)
+        # Add sector column - vectorized hash probe into the reverse index
+        df['sector_category'] = (
+            df['symbol'].map(self.sector_map).fillna('unknown').astype('category')
+        )
         
         # Group by sector
-        sector_stats = df.groupby('sector_category').agg({
+        sector_stats = df.groupby('sector_category', observed=True).agg({
             'market_cap': ['mean', 'median'],
             'pe_ratio': ['mean', 'median'],
             'profit_margin': ['mean', 'median'],
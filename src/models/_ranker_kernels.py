@@ -0,0 +1,50 @@
+"""
+JIT-compiled kernels for the portfolio ranker
+
+Arrays-in, arrays-out: pandas stays at the boundary. The njit shim in
+helpers degrades these to plain Python when numba is absent, so callers
+should gate on NUMBA_AVAILABLE for large inputs.
+"""
+
+import numpy as np
+
+from ..utils.helpers import njit
+
+
+@njit(cache=True)
+def rank_and_topk(X, w, k):
+    """
+    Weighted rank scores plus top-k selection in one compiled pass
+
+    Args:
+        X: (n_companies, n_factors) float64 score matrix
+        w: (n_factors,) weight vector
+        k: number of top indices to return
+
+    Returns:
+        (scores, top_idx) - top_idx is ordered best-first
+    """
+    n, m = X.shape
+    scores = np.empty(n, dtype=np.float64)
+    for i in range(n):
+        s = 0.0
+        for j in range(m):
+            s += X[i, j] * w[j]
+        scores[i] = s
+
+    if k > n:
+        k = n
+    top_idx = np.zeros(k, dtype=np.int64)
+    top_scores = np.full(k, -np.inf)
+    for i in range(n):
+        s = scores[i]
+        # NaN scores compare False and are skipped, like a NaN-last sort
+        if s > top_scores[k - 1]:
+            pos = k - 1
+            while pos > 0 and top_scores[pos - 1] < s:
+                top_scores[pos] = top_scores[pos - 1]
+                top_idx[pos] = top_idx[pos - 1]
+                pos -= 1
+            top_scores[pos] = s
+            top_idx[pos] = i
+    return scores, top_idx
@@ -5,25 +5,218 @@ Analyzes company health from multiple dimensions and generates pros/cons
 
 import pandas as pd
 import numpy as np
-import sys
 import os
+from bisect import bisect_right
 
-sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
+from ..utils.logger import logger
+from ..utils.helpers import format_market_cap, njit
+
+
+@njit(cache=True)
+def _pros_cons_flags(fin_strength, margin, roe, growth, pe, peg, beta, fcf,
+                     mcap, ret_1y, div_yield, z_score, is_tech):
+    """
+    Evaluate the numeric pros/cons thresholds for every company in one pass
+    (JIT-compiled), returning a rule-flag matrix aligned with _RULE_TEMPLATES
+    """
+    n = fin_strength.shape[0]
+    flags = np.zeros((n, 27), dtype=np.int8)
+    for i in range(n):
+        if fin_strength[i] > 70:
+            flags[i, 0] = 1
+        elif fin_strength[i] < 40:
+            flags[i, 1] = 1
+
+        pm = margin[i]
+        if pm > 0.20:
+            flags[i, 2] = 1
+        elif pm > 0.10:
+            flags[i, 3] = 1
+        elif pm < 0:
+            flags[i, 4] = 1
+        elif pm < 0.05:
+            flags[i, 5] = 1
+
+        if roe[i] > 0.20:
+            flags[i, 6] = 1
+        elif roe[i] < 0:
+            flags[i, 7] = 1
+
+        rg = growth[i]
+        if rg > 0.15:
+            flags[i, 8] = 1
+        elif rg > 0.08:
+            flags[i, 9] = 1
+        elif rg < 0:
+            flags[i, 10] = 1
+        elif rg < 0.03:
+            flags[i, 11] = 1
+
+        if not np.isnan(pe[i]):
+            if pe[i] < 15:
+                flags[i, 12] = 1
+            elif pe[i] > 40:
+                flags[i, 13] = 1
+
+        if not np.isnan(peg[i]) and peg[i] > 0:
+            if peg[i] < 1.0:
+                flags[i, 14] = 1
+            elif peg[i] > 2.0:
+                flags[i, 15] = 1
+
+        if beta[i] < 0.8:
+            flags[i, 16] = 1
+        elif beta[i] > 1.5:
+            flags[i, 17] = 1
+
+        if not np.isnan(fcf[i]):
+            if fcf[i] > 0:
+                flags[i, 18] = 1
+            elif fcf[i] < 0:
+                flags[i, 19] = 1
+
+        if mcap[i] > 100e9:
+            flags[i, 20] = 1
+
+        if not np.isnan(ret_1y[i]):
+            if ret_1y[i] > 30:
+                flags[i, 21] = 1
+            elif ret_1y[i] < -20:
+                flags[i, 22] = 1
+
+        if not np.isnan(div_yield[i]) and div_yield[i] > 0.02:
+            flags[i, 23] = 1
+
+        if is_tech[i] and rg > 0.15:
+            flags[i, 24] = 1
+
+        if z_score[i] > 3.0:
+            flags[i, 25] = 1
+        elif z_score[i] < 1.8:
+            flags[i, 26] = 1
+    return flags
+
+
+# (is_pro, template, field, scale) per rule id. Templates are pre-parsed
+# str.format strings sharing one parsed FormatSpec across calls; field None
+# marks a constant message, a callable scale formats the raw value itself.
+# Strings are only built for the companies a caller actually displays
+_RULE_TEMPLATES = (
+    (True,  "Strong financial position with low debt (D/E: {:.2f})", 'debt_to_equity', 1.0),
+    (False, "High debt levels may pose risk (D/E: {:.2f})", 'debt_to_equity', 1.0),
+    (True,  "Exceptional profit margins ({:.1f}%)", 'profit_margin', 100.0),
+    (True,  "Healthy profit margins ({:.1f}%)", 'profit_margin', 100.0),
+    (False, "Company is currently unprofitable (margin: {:.1f}%)", 'profit_margin', 100.0),
+    (False, "Thin profit margins ({:.1f}%)", 'profit_margin', 100.0),
+    (True,  "Strong return on equity (ROE: {:.1f}%)", 'roe', 100.0),
+    (False, "Negative return on equity", None, 0.0),
+    (True,  "Impressive revenue growth ({:.1f}% YoY)", 'revenue_growth', 100.0),
+    (True,  "Solid revenue growth ({:.1f}% YoY)", 'revenue_growth', 100.0),
+    (False, "Declining revenues ({:.1f}% YoY)", 'revenue_growth', 100.0),
+    (False, "Slow revenue growth ({:.1f}% YoY)", 'revenue_growth', 100.0),
+    (True,  "Attractively valued (P/E: {:.1f})", 'pe_ratio', 1.0),
+    (False, "High valuation multiple (P/E: {:.1f})", 'pe_ratio', 1.0),
+    (True,  "Growth at reasonable price (PEG: {:.2f})", 'peg_ratio', 1.0),
+    (False, "Expensive relative to growth (PEG: {:.2f})", 'peg_ratio', 1.0),
+    (True,  "Lower volatility than market (Beta: {:.2f})", 'beta', 1.0),
+    (False, "Higher volatility than market (Beta: {:.2f})", 'beta', 1.0),
+    (True,  "Generates strong free cash flow (${:.2f}B)", 'free_cash_flow', 1e-9),
+    (False, "Negative free cash flow", None, 0.0),
+    (True,  "Large, established company ({})", 'market_cap', format_market_cap),
+    (True,  "Strong 1-year performance (+{:.1f}%)", 'return_1y', 1.0),
+    (False, "Poor 1-year performance ({:.1f}%)", 'return_1y', 1.0),
+    (True,  "Pays dividend (Yield: {:.2f}%)", 'dividend_yield', 100.0),
+    (True,  "Strong growth in tech sector", None, 0.0),
+    (True,  "Low bankruptcy risk (Altman Z-Score)", None, 0.0),
+    (False, "Higher financial distress risk (Altman Z-Score)", None, 0.0),
+)
+
+
+# The scorer touches a fixed subset of the engineered table; projecting at
+# read time skips parsing and storing everything else
+NEEDED_COLS = [
+    'symbol', 'company_name', 'sector_category', 'market_cap', 'current_price',
+    'profit_margin', 'roe', 'debt_to_equity', 'current_ratio',
+    'free_cash_flow', 'pe_ratio', 'peg_ratio', 'revenue_growth', 'beta',
+    'return_1y', 'dividend_yield', 'altman_z_score', 'quality_score',
+    'value_score', 'growth_score', 'momentum_score', 'risk_score',
+    'risk_category', 'financial_health', 'is_profitable',
+]
+
+# Load-time dtype map: category for the low-cardinality labels. The ratio
+# columns stay float64 - the pros/cons rules compare them against float64
+# literals, and a float32 load flips rules at exact thresholds (a stored
+# 3.0% growth reads back as float32(0.03) < 0.03) besides nudging the
+# displayed beta/D-E strings
+DTYPES = {
+    'sector_category': 'category', 'risk_category': 'category',
+    'financial_health': 'category',
+}
+
+
+# Recommendation decision table: rows are 10-point health-score bins,
+# columns are {Low, Medium, High} risk. Flattens the old 7-branch cascade
+# into one indexed lookup
+_REC_SELL = "Sell - Poor fundamentals, high risk"
+_REC_HOLD_SELL = "Hold/Sell - Significant concerns, review risk tolerance"
+_REC_HOLD_STABLE = "Hold - Stable but limited upside potential"
+_REC_HOLD_MIXED = "Hold - Mixed signals, suitable for risk-tolerant investors"
+_REC_BUY_GOOD = "Buy - Good fundamentals, suitable for growth portfolios"
+_REC_BUY_STRONG = "Buy - Strong fundamentals, monitor risk factors"
+_REC_STRONG_BUY = "Strong Buy - Excellent health with low risk"
+
+_REC_TABLE = (
+    (_REC_SELL, _REC_SELL, _REC_SELL),                      # 0-9
+    (_REC_SELL, _REC_SELL, _REC_SELL),                      # 10-19
+    (_REC_SELL, _REC_SELL, _REC_SELL),                      # 20-29
+    (_REC_SELL, _REC_SELL, _REC_SELL),                      # 30-39
+    (_REC_HOLD_SELL, _REC_HOLD_SELL, _REC_HOLD_SELL),       # 40-49
+    (_REC_HOLD_STABLE, _REC_HOLD_MIXED, _REC_HOLD_MIXED),   # 50-59
+    (_REC_BUY_GOOD, _REC_BUY_GOOD, _REC_HOLD_MIXED),        # 60-69
+    (_REC_STRONG_BUY, _REC_BUY_STRONG, _REC_BUY_STRONG),    # 70-79
+    (_REC_STRONG_BUY, _REC_BUY_STRONG, _REC_BUY_STRONG),    # 80-89
+    (_REC_STRONG_BUY, _REC_BUY_STRONG, _REC_BUY_STRONG),    # 90-99
+    (_REC_STRONG_BUY, _REC_BUY_STRONG, _REC_BUY_STRONG),    # 100
+)
+
+_RISK_COL = {"Low Risk": 0, "Medium Risk": 1, "High Risk": 2}
+
+_RATING_THRESHOLDS = (40, 50, 60, 70, 80)
+_RATING_NAMES = ("Poor", "Below Average", "Fair", "Good", "Very Good", "Excellent")
+
+# All 101 possible 20-char score bars, pre-rendered once
+_BARS_20 = tuple(
+    "█" * int(s * 20 / 100) + "░" * (20 - int(s * 20 / 100)) for s in range(101)
+)
+
+# Report separators, built once instead of per format_analysis call
+_EQ = "=" * 80
+_DASH = "-" * 80
 
-from src.utils.logger import logger
-from src.utils.helpers import format_market_cap
 
 class CompanyHealthScorer:
     """
     Comprehensive company health analysis
     Generates health score (0-100%) and detailed pros/cons
     """
-    
+
     def __init__(self, data_path: str = 'data/processed/stock_universe_engineered.csv'):
         """Initialize with engineered dataset"""
-        self.df = pd.read_csv(data_path)
+        # Prefer the Parquet sibling: columnar projection, no string parsing,
+        # and dtypes/categories come back exactly as written. First load from
+        # a CSV-only tree writes the sibling so later loads take this path
+        stem = os.path.splitext(data_path)[0]
+        parquet_path = f"{stem}.parquet"
+        if os.path.exists(parquet_path):
+            self.df = pd.read_parquet(parquet_path, columns=NEEDED_COLS)
+        else:
+            # The sibling is shared with every read_df consumer, so migrate
+            # the full table before projecting down to the scorer's columns
+            full = pd.read_csv(data_path)
+            full.to_parquet(parquet_path, compression='snappy', index=False)
+            self.df = full[NEEDED_COLS].astype(DTYPES)
         logger.info(f"Loaded {len(self.df)} companies for health analysis")
-        
+
         # Define weight for each health dimension
         self.weights = {
             'financial_strength': 0.25,
@@ -33,44 +226,75 @@ class CompanyHealthScorer:
             'risk_management': 0.10,
             'market_position': 0.10
         }
+        self._weights_vec = np.array(list(self.weights.values()))
+
+        # Pre-build a symbol index so per-company analysis is a dict probe
+        # instead of a full-frame boolean scan on every call
+        self.df = self.df.drop_duplicates('symbol').set_index('symbol')
+        self._precompute_scores()
+        self._precompute_rule_flags()
+        self._records = self.df.to_dict(orient='index')
+        self._symbols = frozenset(self._records)
+        self._symbol_list = self.df.index[:20].tolist()
+
+        # Completed analyses, keyed on uppercased symbol. The underlying
+        # data only changes when the instance is rebuilt, so repeat queries
+        # (UI re-renders, API calls) are served straight from here
+        self._analysis_cache = {}
     
-    def analyze_company(self, symbol: str) -> dict:
+    def analyze_company(self, symbol: str, details: bool = True) -> dict:
         """
         Complete health analysis for a company
-        
+
+        Args:
+            details: when False, skip pros/cons and key-metric assembly and
+                     return just the scores - the cheap path for bulk
+                     consumers (screeners, ranking) that only want numbers
+
         Returns:
-            dict with keys: overall_health, dimension_scores, pros, cons, 
+            dict with keys: overall_health, dimension_scores, pros, cons,
                            risk_level, recommendation
         """
-        
+
         symbol = symbol.upper()
-        
-        # Get company data
-        company_data = self.df[self.df['symbol'] == symbol]
-        
-        if company_data.empty:
+
+        cached = self._analysis_cache.get(symbol)
+        if cached is not None:
+            return cached
+
+        # Cheap membership check first, then a clean dict lookup
+        if symbol not in self._symbols:
             return {
                 'error': f"Symbol {symbol} not found in database",
-                'available_symbols': self.df['symbol'].tolist()[:20]
+                'available_symbols': self._symbol_list
             }
-        
-        company = company_data.iloc[0]
-        
-        logger.info(f"Analyzing health for {symbol} - {company['company_name']}")
-        
+
+        company = self._records[symbol]
+
         # Calculate dimension scores
-        dimension_scores = self._calculate_dimension_scores(company)
-        
+        dimension_scores, scores_arr = self._calculate_dimension_scores(company)
+
         # Calculate overall health
-        overall_health = self._calculate_overall_health(dimension_scores)
-        
-        # Generate pros and cons
-        pros, cons = self._generate_pros_cons(company, dimension_scores)
-        
+        overall_health = self._calculate_overall_health(scores_arr)
+
         # Determine risk level and recommendation
         risk_level = self._assess_risk_level(company)
         recommendation = self._generate_recommendation(overall_health, risk_level, company)
-        
+
+        if not details:
+            return {
+                'symbol': symbol,
+                'overall_health': round(overall_health, 2),
+                'dimension_scores': dimension_scores,
+                'risk_level': risk_level,
+                'recommendation': recommendation
+            }
+
+        logger.info(f"Analyzing health for {symbol} - {company['company_name']}")
+
+        # Generate pros and cons
+        pros, cons = self._generate_pros_cons(symbol, company)
+
         result = {
             'symbol': symbol,
             'company_name': company['company_name'],
@@ -84,276 +308,231 @@ class CompanyHealthScorer:
             'sector': company['sector_category'],
             'market_cap': company['market_cap']
         }
-        
+
+        self._analysis_cache[symbol] = result
         return result
+
+    def analyze_many(self, symbols) -> list:
+        """
+        Analyze a batch of symbols in one pass
+
+        The six dimension columns are sliced once and every overall health
+        score falls out of a single matrix-vector product; per-symbol work is
+        just dict assembly against the precomputed rule flags. Unknown
+        symbols are skipped; results come back in input order.
+        """
+        seen = set()
+        wanted = [s for s in map(str.upper, symbols)
+                  if s in self._symbols and not (s in seen or seen.add(s))]
+        scores_mat = self.df.loc[wanted, list(self.weights)].to_numpy(np.float64)
+        overall = np.clip(scores_mat @ self._weights_vec, 0, 100)
+
+        results = []
+        for i, symbol in enumerate(wanted):
+            cached = self._analysis_cache.get(symbol)
+            if cached is not None:
+                results.append(cached)
+                continue
+
+            company = self._records[symbol]
+            risk_level = self._assess_risk_level(company)
+            pros, cons = self._generate_pros_cons(symbol, company)
+            result = {
+                'symbol': symbol,
+                'company_name': company['company_name'],
+                'overall_health': round(float(overall[i]), 2),
+                'dimension_scores': dict(zip(self.weights, scores_mat[i])),
+                'pros': pros,
+                'cons': cons,
+                'risk_level': risk_level,
+                'recommendation': self._generate_recommendation(
+                    overall[i], risk_level, company
+                ),
+                'key_metrics': self._extract_key_metrics(company),
+                'sector': company['sector_category'],
+                'market_cap': company['market_cap']
+            }
+            self._analysis_cache[symbol] = result
+            results.append(result)
+
+        return results
     
-    def _calculate_dimension_scores(self, company: pd.Series) -> dict:
-        """Calculate scores for each health dimension"""
-        
-        scores = {}
-        
+    def _precompute_scores(self):
+        """
+        Pre-compute every dimension score for the whole universe in one
+        vectorized pass; analyze_company then just reads the stored values
+        """
+        df = self.df
+        col = self._column
+
+        def row_nanmean(*parts):
+            stacked = np.column_stack(parts)
+            counts = np.sum(~np.isnan(stacked), axis=1)
+            totals = np.nansum(stacked, axis=1)
+            return np.where(counts > 0, totals / np.maximum(counts, 1), np.nan)
+
         # 1. Financial Strength (Debt, Cash Flow, Liquidity)
-        debt_score = self._score_debt_level(company)
-        cash_score = self._score_cash_flow(company)
-        liquidity_score = self._score_liquidity(company)
-        scores['financial_strength'] = np.nanmean([debt_score, cash_score, liquidity_score])
-        
-        # 2. Profitability (Margins, ROE, ROA)
-        margin_score = min(100, company.get('profit_margin', 0) * 500)  # Scale up
-        roe_score = min(100, company.get('roe', 0) * 500)
-        quality_score = company.get('quality_score', 50)
-        scores['profitability'] = np.nanmean([margin_score, roe_score, quality_score])
-        
+        # Debt tiers: <0.3 = excellent, 0.3-0.7 = good, 0.7-1.5 = fair, >1.5 = poor
+        de = col('debt_to_equity')
+        debt_score = np.select(
+            [np.isnan(de), de < 0.3, de < 0.7, de < 1.5],
+            [50.0, 100.0, 80.0, 60.0],
+            default=np.clip(60 - (de - 1.5) * 20, 0, None)
+        )
+
+        fcf = col('free_cash_flow')
+        mcap = col('market_cap')
+        fcf_yield = np.where(mcap > 0, fcf / np.where(mcap > 0, mcap, 1) * 100, 0)
+        cash_score = np.select(
+            [np.isnan(fcf) | (fcf == 0), fcf > 0],
+            [50.0, np.fmin(100, 50 + fcf_yield * 10)],
+            default=30.0
+        )
+
+        cr = col('current_ratio')
+        liquidity_score = np.select(
+            [np.isnan(cr), cr > 2.5, cr > 2.0, cr > 1.5, cr > 1.0],
+            [50.0, 100.0, 90.0, 75.0, 60.0],
+            default=40.0
+        )
+        df['financial_strength'] = row_nanmean(debt_score, cash_score, liquidity_score)
+
+        # 2. Profitability (Margins, ROE, quality)
+        margin_score = np.fmin(100, col('profit_margin') * 500)  # Scale up
+        roe_score = np.fmin(100, col('roe') * 500)
+        quality_score = col('quality_score', 50)
+        df['profitability'] = row_nanmean(margin_score, roe_score, quality_score)
+
         # 3. Growth Trajectory
-        scores['growth_trajectory'] = company.get('growth_score', 50)
-        
+        df['growth_trajectory'] = col('growth_score', 50)
+
         # 4. Valuation (Is it reasonably priced?)
-        scores['valuation'] = company.get('value_score', 50)
-        
+        df['valuation'] = col('value_score', 50)
+
         # 5. Risk Management
-        risk_score = 100 - (company.get('risk_score', 5) * 10)  # Invert risk score
-        beta_score = max(0, 100 - abs(company.get('beta', 1) - 1) * 50)
-        scores['risk_management'] = np.nanmean([risk_score, beta_score])
-        
+        risk_score = 100 - (col('risk_score', 5) * 10)  # Invert risk score
+        beta_score = np.fmax(0, 100 - np.abs(col('beta', 1) - 1) * 50)
+        df['risk_management'] = row_nanmean(risk_score, beta_score)
+
         # 6. Market Position (Size, Momentum)
-        market_cap = company.get('market_cap', 0)
-        size_score = min(100, np.log10(market_cap) * 10) if market_cap > 0 else 0
-        momentum_score = company.get('momentum_score', 50)
-        scores['market_position'] = np.nanmean([size_score, momentum_score])
-        
-        # Round all scores
-        scores = {k: round(v, 2) for k, v in scores.items()}
-        
-        return scores
-    
-    def _score_debt_level(self, company: pd.Series) -> float:
-        """Score based on debt levels (lower debt = better)"""
-        debt_to_equity = company.get('debt_to_equity', 0.5)
-        
-        if pd.isna(debt_to_equity):
-            return 50  # Neutral
-        
-        # Scoring: <0.3 = excellent, 0.3-0.7 = good, 0.7-1.5 = fair, >1.5 = poor
-        if debt_to_equity < 0.3:
-            return 100
-        elif debt_to_equity < 0.7:
-            return 80
-        elif debt_to_equity < 1.5:
-            return 60
-        else:
-            return max(0, 60 - (debt_to_equity - 1.5) * 20)
-    
-    def _score_cash_flow(self, company: pd.Series) -> float:
-        """Score based on free cash flow"""
-        fcf = company.get('free_cash_flow', 0)
-        
-        if pd.isna(fcf) or fcf == 0:
-            return 50  # Neutral if missing
-        
-        # Positive FCF is good
-        if fcf > 0:
-            # Score based on FCF as % of market cap
-            fcf_yield = (fcf / company.get('market_cap', 1)) * 100
-            return min(100, 50 + fcf_yield * 10)
+        size_score = np.where(
+            mcap > 0, np.fmin(100, np.log10(np.where(mcap > 0, mcap, 1)) * 10), 0
+        )
+        momentum_score = col('momentum_score', 50)
+        df['market_position'] = row_nanmean(size_score, momentum_score)
+
+        dim_cols = list(self.weights)
+        df[dim_cols] = np.round(df[dim_cols].to_numpy(np.float64), 2)
+
+        # Risk signal counts: how many of {risk_category, financial_health,
+        # unprofitability} point high or low. _assess_risk_level then reduces
+        # to a single comparison per company
+        def label(name, default):
+            if name in df.columns:
+                return df[name].astype(object).fillna(default)
+            return pd.Series(default, index=df.index)
+
+        risk_cat = label('risk_category', 'Medium Risk')
+        fin_health = label('financial_health', 'Medium Risk')
+        if 'is_profitable' in df.columns:
+            unprofitable = ~df['is_profitable'].astype(bool)
         else:
-            return 30  # Negative FCF is concerning
-    
-    def _score_liquidity(self, company: pd.Series) -> float:
-        """Score based on current ratio"""
-        current_ratio = company.get('current_ratio', 1.5)
-        
-        if pd.isna(current_ratio):
-            return 50
-        
-        # Current ratio > 1.5 is good, > 2.0 is excellent
-        if current_ratio > 2.5:
-            return 100
-        elif current_ratio > 2.0:
-            return 90
-        elif current_ratio > 1.5:
-            return 75
-        elif current_ratio > 1.0:
-            return 60
+            unprofitable = pd.Series(False, index=df.index)
+
+        df['_high_signals'] = (
+            (risk_cat == 'High Risk').astype('int8')
+            + (fin_health == 'High Risk').astype('int8')
+            + unprofitable.astype('int8')
+        )
+        df['_low_signals'] = (
+            (risk_cat == 'Low Risk').astype('int8')
+            + (fin_health == 'Low Risk').astype('int8')
+        )
+
+    def _precompute_rule_flags(self):
+        """Run the JIT rule engine over the whole universe once at load"""
+        col = self._column
+        if 'sector_category' in self.df.columns:
+            is_tech = (self.df['sector_category'] == 'tech').to_numpy()
         else:
-            return 40
-    
-    def _calculate_overall_health(self, dimension_scores: dict) -> float:
-        """Calculate weighted overall health score"""
-        
-        overall = sum(
-            dimension_scores.get(dimension, 50) * weight
-            for dimension, weight in self.weights.items()
+            is_tech = np.zeros(len(self.df), dtype=bool)
+
+        self._rule_flags = _pros_cons_flags(
+            col('financial_strength'), col('profit_margin'), col('roe'),
+            col('revenue_growth'), col('pe_ratio'), col('peg_ratio'),
+            col('beta'), col('free_cash_flow'), col('market_cap'),
+            col('return_1y'), col('dividend_yield'), col('altman_z_score'),
+            is_tech,
         )
-        
-        return min(100, max(0, overall))
+        self._row_pos = {symbol: i for i, symbol in enumerate(self.df.index)}
+
+    def _column(self, name: str, default: float = np.nan) -> np.ndarray:
+        """One column as a float64 array, or a filled default when absent"""
+        if name in self.df.columns:
+            return self.df[name].to_numpy(np.float64)
+        return np.full(len(self.df), default)
+
+    def _calculate_dimension_scores(self, company: dict) -> tuple:
+        """
+        Read the pre-computed dimension scores for one company
+
+        Returns both the serializable dict and the raw length-6 array (in
+        self.weights order) that the weighted overall score dots against.
+        """
+        # _precompute_scores guarantees every dimension column exists, so
+        # these are plain dict probes with no membership check
+        arr = np.array([company[dimension] for dimension in self.weights])
+        return dict(zip(self.weights, arr)), arr
+
+    def _calculate_overall_health(self, scores_arr: np.ndarray) -> float:
+        """Calculate weighted overall health score (one dot product)"""
+
+        return float(np.clip(scores_arr @ self._weights_vec, 0, 100))
     
-    def _generate_pros_cons(self, company: pd.Series, dimension_scores: dict) -> tuple:
-        """Generate detailed pros and cons"""
-        
+    def _generate_pros_cons(self, symbol: str, company: dict) -> tuple:
+        """Map the pre-computed rule flags for one company to display strings"""
+
+        row = self._rule_flags[self._row_pos[symbol]]
+
         pros = []
         cons = []
-        
-        # Financial Strength
-        if dimension_scores['financial_strength'] > 70:
-            debt = company.get('debt_to_equity', 0)
-            pros.append(f"Strong financial position with low debt (D/E: {debt:.2f})")
-        elif dimension_scores['financial_strength'] < 40:
-            debt = company.get('debt_to_equity', 0)
-            cons.append(f"High debt levels may pose risk (D/E: {debt:.2f})")
-        
-        # Profitability
-        profit_margin = company.get('profit_margin', 0)
-        if profit_margin > 0.20:
-            pros.append(f"Exceptional profit margins ({profit_margin*100:.1f}%)")
-        elif profit_margin > 0.10:
-            pros.append(f"Healthy profit margins ({profit_margin*100:.1f}%)")
-        elif profit_margin < 0:
-            cons.append(f"Company is currently unprofitable (margin: {profit_margin*100:.1f}%)")
-        elif profit_margin < 0.05:
-            cons.append(f"Thin profit margins ({profit_margin*100:.1f}%)")
-        
-        # ROE
-        roe = company.get('roe', 0)
-        if roe > 0.20:
-            pros.append(f"Strong return on equity (ROE: {roe*100:.1f}%)")
-        elif roe < 0:
-            cons.append("Negative return on equity")
-        
-        # Growth
-        revenue_growth = company.get('revenue_growth', 0)
-        if revenue_growth > 0.15:
-            pros.append(f"Impressive revenue growth ({revenue_growth*100:.1f}% YoY)")
-        elif revenue_growth > 0.08:
-            pros.append(f"Solid revenue growth ({revenue_growth*100:.1f}% YoY)")
-        elif revenue_growth < 0:
-            cons.append(f"Declining revenues ({revenue_growth*100:.1f}% YoY)")
-        elif revenue_growth < 0.03:
-            cons.append(f"Slow revenue growth ({revenue_growth*100:.1f}% YoY)")
-        
-        # Valuation
-        pe_ratio = company.get('pe_ratio', 0)
-        if pd.notna(pe_ratio):
-            if pe_ratio < 15:
-                pros.append(f"Attractively valued (P/E: {pe_ratio:.1f})")
-            elif pe_ratio > 40:
-                cons.append(f"High valuation multiple (P/E: {pe_ratio:.1f})")
-        
-        peg_ratio = company.get('peg_ratio', 0)
-        if pd.notna(peg_ratio) and peg_ratio > 0:
-            if peg_ratio < 1.0:
-                pros.append(f"Growth at reasonable price (PEG: {peg_ratio:.2f})")
-            elif peg_ratio > 2.0:
-                cons.append(f"Expensive relative to growth (PEG: {peg_ratio:.2f})")
-        
-        # Risk factors
-        beta = company.get('beta', 1)
-        if beta < 0.8:
-            pros.append(f"Lower volatility than market (Beta: {beta:.2f})")
-        elif beta > 1.5:
-            cons.append(f"Higher volatility than market (Beta: {beta:.2f})")
-        
-        # Cash flow
-        fcf = company.get('free_cash_flow', 0)
-        if pd.notna(fcf) and fcf > 0:
-            fcf_billions = fcf / 1e9
-            pros.append(f"Generates strong free cash flow (${fcf_billions:.2f}B)")
-        elif pd.notna(fcf) and fcf < 0:
-            cons.append("Negative free cash flow")
-        
-        # Market position
-        market_cap = company.get('market_cap', 0)
-        if market_cap > 100e9:
-            pros.append(f"Large, established company ({format_market_cap(market_cap)})")
-        
-        # Momentum
-        return_1y = company.get('return_1y', 0)
-        if pd.notna(return_1y):
-            if return_1y > 30:
-                pros.append(f"Strong 1-year performance (+{return_1y:.1f}%)")
-            elif return_1y < -20:
-                cons.append(f"Poor 1-year performance ({return_1y:.1f}%)")
-        
-        # Dividend
-        div_yield = company.get('dividend_yield', 0)
-        if pd.notna(div_yield) and div_yield > 0.02:
-            pros.append(f"Pays dividend (Yield: {div_yield*100:.2f}%)")
-        
-        # Sector-specific insights
-        sector = company.get('sector_category', '')
-        if sector == 'tech' and revenue_growth > 0.15:
-            pros.append("Strong growth in tech sector")
-        
-        # Financial health (Altman Z-Score)
-        z_score = company.get('altman_z_score', 0)
-        if z_score > 3.0:
-            pros.append("Low bankruptcy risk (Altman Z-Score)")
-        elif z_score < 1.8:
-            cons.append("Higher financial distress risk (Altman Z-Score)")
-        
+        for flag, (is_pro, template, field, scale) in zip(row, _RULE_TEMPLATES):
+            if not flag:
+                continue
+            if field is None:
+                text = template
+            elif callable(scale):
+                text = template.format(scale(company[field]))
+            else:
+                text = template.format(company[field] * scale)
+            (pros if is_pro else cons).append(text)
+
         # Ensure we have at least some pros and cons
         if not pros:
             pros.append("Company has stable operations")
-        
+
         if not cons:
             cons.append("Monitor industry competition")
-        
+
         return pros, cons
-    
-    def _assess_risk_level(self, company: pd.Series) -> str:
-        """Determine overall risk level"""
-        
-        risk_category = company.get('risk_category', 'Medium Risk')
-        financial_health = company.get('financial_health', 'Medium Risk')
-        is_profitable = company.get('is_profitable', True)
-        
-        # Combine signals
-        risk_signals = []
-        
-        if risk_category == 'High Risk':
-            risk_signals.append('high')
-        elif risk_category == 'Low Risk':
-            risk_signals.append('low')
-        
-        if financial_health == 'High Risk':
-            risk_signals.append('high')
-        elif financial_health == 'Low Risk':
-            risk_signals.append('low')
-        
-        if not is_profitable:
-            risk_signals.append('high')
-        
-        # Determine overall
-        high_count = risk_signals.count('high')
-        low_count = risk_signals.count('low')
-        
-        if high_count >= 2:
+
+    def _assess_risk_level(self, company: dict) -> str:
+        """Determine overall risk level from the precomputed signal counts"""
+
+        if company['_high_signals'] >= 2:
             return "High Risk"
-        elif low_count >= 2:
+        if company['_low_signals'] >= 2:
             return "Low Risk"
-        else:
-            return "Medium Risk"
+        return "Medium Risk"
     
-    def _generate_recommendation(self, health_score: float, risk_level: str, 
-                                 company: pd.Series) -> str:
-        """Generate investment recommendation"""
-        
-        # Simple recommendation logic
-        if health_score >= 70 and risk_level == "Low Risk":
-            return "Strong Buy - Excellent health with low risk"
-        elif health_score >= 70:
-            return "Buy - Strong fundamentals, monitor risk factors"
-        elif health_score >= 60 and risk_level != "High Risk":
-            return "Buy - Good fundamentals, suitable for growth portfolios"
-        elif health_score >= 50 and risk_level == "Low Risk":
-            return "Hold - Stable but limited upside potential"
-        elif health_score >= 50:
-            return "Hold - Mixed signals, suitable for risk-tolerant investors"
-        elif health_score >= 40:
-            return "Hold/Sell - Significant concerns, review risk tolerance"
-        else:
-            return "Sell - Poor fundamentals, high risk"
+    def _generate_recommendation(self, health_score: float, risk_level: str,
+                                 company: dict) -> str:
+        """Generate investment recommendation (table lookup)"""
+
+        bucket = min(max(int(health_score) // 10, 0), 10)
+        return _REC_TABLE[bucket][_RISK_COL.get(risk_level, 1)]
     
-    def _extract_key_metrics(self, company: pd.Series) -> dict:
+    def _extract_key_metrics(self, company: dict) -> dict:
         """Extract key metrics for display"""
         
         return {
@@ -375,9 +554,9 @@ class CompanyHealthScorer:
             return f"Error: {analysis['error']}"
         
         output = []
-        output.append("="*80)
+        output.append(_EQ)
         output.append(f"COMPANY HEALTH ANALYSIS: {analysis['company_name']} ({analysis['symbol']})")
-        output.append("="*80)
+        output.append(_EQ)
         output.append("")
         
         # Overall Health
@@ -388,18 +567,18 @@ class CompanyHealthScorer:
         output.append("")
         
         # Dimension Scores
-        output.append("-"*80)
+        output.append(_DASH)
         output.append("HEALTH DIMENSIONS:")
-        output.append("-"*80)
+        output.append(_DASH)
         for dimension, score in analysis['dimension_scores'].items():
             bar = self._create_bar(score)
             output.append(f"{dimension.replace('_', ' ').title():25s}: {score:5.1f}% {bar}")
         output.append("")
         
         # Key Metrics
-        output.append("-"*80)
+        output.append(_DASH)
         output.append("KEY METRICS:")
-        output.append("-"*80)
+        output.append(_DASH)
         metrics = analysis['key_metrics']
         output.append(f"Market Cap: {format_market_cap(metrics['market_cap'])}")
         output.append(f"Current Price: ${metrics['current_price']:.2f}")
@@ -416,44 +595,41 @@ class CompanyHealthScorer:
         output.append("")
         
         # Pros
-        output.append("-"*80)
+        output.append(_DASH)
         output.append("STRENGTHS (PROS):")
-        output.append("-"*80)
+        output.append(_DASH)
         for i, pro in enumerate(analysis['pros'], 1):
             output.append(f"  ✓ {pro}")
         output.append("")
         
         # Cons
-        output.append("-"*80)
+        output.append(_DASH)
         output.append("CONCERNS (CONS):")
-        output.append("-"*80)
+        output.append(_DASH)
         for i, con in enumerate(analysis['cons'], 1):
             output.append(f"  ⚠ {con}")
         output.append("")
         
-        output.append("="*80)
+        output.append(_EQ)
         
         return "\n".join(output)
     
     def _health_rating(self, score: float) -> str:
-        """Convert numeric score to rating"""
-        if score >= 80:
-            return "Excellent"
-        elif score >= 70:
-            return "Very Good"
-        elif score >= 60:
-            return "Good"
-        elif score >= 50:
-            return "Fair"
-        elif score >= 40:
-            return "Below Average"
-        else:
-            return "Poor"
+        """Convert numeric score to rating (binary search over thresholds)"""
+        return _RATING_NAMES[bisect_right(_RATING_THRESHOLDS, score)]
     
     def _create_bar(self, score: float, width: int = 20) -> str:
         """Create visual bar for score"""
+        if width == 20:
+            return _BARS_20[max(0, min(100, int(score)))]
         filled = int((score / 100) * width)
         return "█" * filled + "░" * (width - filled)
 
-# Global instance
-health_scorer = CompanyHealthScorer()
\ No newline at end of file
+# Global instance, created lazily on first access
+def __getattr__(name):
+    """Build the global scorer on first attribute access (PEP 562), so
+    importing the module no longer pays the dataset load"""
+    if name == 'health_scorer':
+        globals()['health_scorer'] = CompanyHealthScorer()
+        return globals()['health_scorer']
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
\ No newline at end of file
@@ -1,9 +1,16 @@
 import yaml
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, Any
 import os
 from dotenv import load_dotenv
 
+@lru_cache(maxsize=8)
+def _load_yaml(path: str, mtime: float) -> Dict:
+    """Parse a YAML file once per (path, mtime); edits invalidate"""
+    with open(path, 'r') as f:
+        return yaml.safe_load(f)
+
 class Config:
     """
     Configuration manager
@@ -17,9 +24,9 @@ class Config:
         load_dotenv()
     
     def load(self):
-        """Load configuration from YAML"""
-        with open(self.config_path, 'r') as f:
-            self._config = yaml.safe_load(f)
+        """Load configuration from YAML (memoized by path + mtime)"""
+        self._config = _load_yaml(str(self.config_path),
+                                  os.path.getmtime(self.config_path))
     
     def get(self, key: str, default: Any = None) -> Any:
         """
@@ -1,10 +1,25 @@
+import os
 import pandas as pd
 import numpy as np
-from typing import List, Dict, Union
+from typing import List, Dict, Optional, Union
 import time
-from functools import wraps
+from functools import lru_cache, wraps
 from src.utils.logger import logger
 
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        """No-op decorator when numba is not installed"""
+        def decorator(func):
+            return func
+        if args and callable(args[0]):
+            return args[0]
+        return decorator
+
 def retry_on_failure(max_retries: int = 3, delay: float = 1.0):
     """
     Decorator to retry function on failure
@@ -25,6 +40,97 @@ def retry_on_failure(max_retries: int = 3, delay: float = 1.0):
         return wrapper
     return decorator
 
+def write_df(df: pd.DataFrame, stem: str, also_csv: bool = False) -> str:
+    """
+    Persist a DataFrame as Snappy-compressed Parquet (primary output format)
+
+    Args:
+        stem: Output path without extension, e.g. 'data/processed/stock_universe_full'
+        also_csv: Emit a CSV sibling for tools that cannot read Parquet
+    """
+    path = f"{stem}.parquet"
+    # 16k-row groups keep column chunks cache-sized for projection reads
+    # while our universe-scale frames still land in a single group; pyarrow
+    # dictionary-encodes the low-cardinality string columns by default
+    df.to_parquet(path, compression='snappy', index=False,
+                  row_group_size=16384, data_page_size=1 << 20)
+    if also_csv:
+        df.to_csv(f"{stem}.csv", index=False)
+    return path
+
+def read_df(stem: str, columns: Optional[List[str]] = None) -> pd.DataFrame:
+    """
+    Load a DataFrame written by write_df, preferring Parquet over legacy CSV
+    """
+    parquet_path = f"{stem}.parquet"
+    if os.path.exists(parquet_path):
+        return pd.read_parquet(parquet_path, columns=columns)
+    return pd.read_csv(f"{stem}.csv", usecols=columns)
+
+def write_categories(categories: Dict[str, pd.DataFrame],
+                     base_dir: str = 'data/processed/universe_by_category'):
+    """
+    Write market-cap categories as one hive-partitioned Parquet dataset
+
+    A single write_dataset call replaces one file per category: the schema is
+    serialized once and readers can prune partitions via the category filter.
+    """
+    import pyarrow as pa
+    import pyarrow.dataset as ds
+
+    combined = pd.concat(
+        [cat_df.assign(category=cat_name) for cat_name, cat_df in categories.items()],
+        ignore_index=True
+    )
+    table = pa.Table.from_pandas(combined, preserve_index=False)
+    ds.write_dataset(
+        table,
+        base_dir=base_dir,
+        format='parquet',
+        partitioning=ds.partitioning(pa.schema([('category', pa.string())]), flavor='hive'),
+        existing_data_behavior='delete_matching'
+    )
+
+def read_category(cat_name: str,
+                  base_dir: str = 'data/processed/universe_by_category') -> pd.DataFrame:
+    """
+    Load one market-cap category, preferring the partitioned dataset over
+    legacy per-category files
+    """
+    if os.path.isdir(base_dir):
+        df = pd.read_parquet(base_dir, filters=[('category', '=', cat_name)])
+        return df.drop(columns='category')
+    return read_df(f'data/processed/category_{cat_name}')
+
+# Low-cardinality string columns worth storing as categoricals: groupby and
+# value_counts run on integer codes, and Parquet dictionary-encodes them.
+# company_name is deliberately absent - it is unique per row, so dictionary
+# codes would only add overhead
+CATEGORICAL_COLUMNS = ['sector', 'industry', 'country', 'sector_category',
+                       'risk_category', 'profitability_status',
+                       'financial_health']
+
+def as_categorical(df: pd.DataFrame,
+                   columns: Optional[List[str]] = None) -> pd.DataFrame:
+    """
+    Convert the low-cardinality string columns present in df to categoricals
+    """
+    for col in (columns if columns is not None else CATEGORICAL_COLUMNS):
+        if col in df.columns and df[col].dtype == object:
+            df[col] = df[col].astype('category')
+    return df
+
+def count_features(stem: str) -> int:
+    """
+    Count the columns of a dataset without loading its rows
+    (Parquet footer metadata, or a header-only CSV read as fallback)
+    """
+    parquet_path = f"{stem}.parquet"
+    if os.path.exists(parquet_path):
+        import pyarrow.parquet as pq
+        return pq.ParquetFile(parquet_path).metadata.num_columns
+    return len(pd.read_csv(f"{stem}.csv", nrows=0).columns)
+
 def calculate_cagr(start_value: float, end_value: float, years: float) -> float:
     """
     Calculate Compound Annual Growth Rate
@@ -47,23 +153,33 @@ def normalize_values(values: Union[pd.Series, np.ndarray],
     """
     Normalize values to 0-100 scale
     """
+    arr = np.asarray(values, dtype=np.float64)
     if method == 'minmax':
-        min_val = values.min()
-        max_val = values.max()
+        min_val = arr.min()
+        max_val = arr.max()
         if max_val == min_val:
-            return pd.Series([50] * len(values)) if isinstance(values, pd.Series) else np.array([50] * len(values))
-        normalized = ((values - min_val) / (max_val - min_val)) * 100
+            normalized = np.full(arr.shape, 50.0)
+        else:
+            # Fold the scale into one multiplier so the array is touched once
+            normalized = (arr - min_val) * (100.0 / (max_val - min_val))
     elif method == 'zscore':
-        normalized = ((values - values.mean()) / values.std()) * 10 + 50
+        normalized = ((arr - arr.mean()) / arr.std()) * 10 + 50
         normalized = np.clip(normalized, 0, 100)
     else:
         raise ValueError(f"Unknown normalization method: {method}")
-    
+
+    if isinstance(values, pd.Series):
+        return pd.Series(normalized, index=values.index)
     return normalized
 
+@lru_cache(maxsize=4096)
 def format_market_cap(market_cap: float) -> str:
     """
     Format market cap in human-readable format
+
+    Pure function of its argument, so repeated renders of the same cap
+    (report rebuilds, dashboard refreshes) hit the cache instead of
+    re-running the float formatting.
     """
     if market_cap >= 1e12:
         return f"${market_cap/1e12:.2f}T"
@@ -77,5 +193,42 @@ def format_market_cap(market_cap: float) -> str:
 def calculate_percentile_rank(value: float, series: pd.Series) -> float:
     """
     Calculate percentile rank of a value in a series (0-100)
+
+    One-shot convenience; for repeated queries against the same series,
+    build a Percentiler so each lookup is a binary search instead of a
+    full scan.
+    """
+    return (series < value).sum() / len(series) * 100
+
+def format_market_caps(values: Union[pd.Series, np.ndarray]) -> np.ndarray:
+    """
+    Vectorized format_market_cap for whole columns
+
+    One np.select pass picks each value's tier; only the final string
+    build touches Python per element.
+    """
+    arr = np.asarray(values, dtype=np.float64)
+    tier = np.select([arr >= 1e12, arr >= 1e9, arr >= 1e6], [0, 1, 2], default=3)
+    scaled = arr / np.array([1e12, 1e9, 1e6, 1.0])[tier]
+    suffixes = np.array(['T', 'B', 'M', ''])[tier]
+    return np.array([
+        f"${v:,.0f}" if t == 3 else f"${v:.2f}{sfx}"
+        for v, t, sfx in zip(scaled, tier, suffixes)
+    ])
+
+class Percentiler:
     """
-    return (series < value).sum() / len(series) * 100
\ No newline at end of file
+    Percentile ranks against a fixed series via one sort + binary search
+
+    Sorting once turns each query from an O(N) scan into an O(log N)
+    searchsorted probe; rank() also accepts an array of values and
+    returns all their ranks in a single vectorized call.
+    """
+
+    def __init__(self, series: Union[pd.Series, np.ndarray]):
+        self._sorted = np.sort(np.asarray(series))
+        self._n = len(self._sorted)
+
+    def rank(self, value):
+        """Percentile rank (0-100) of a value or array of values"""
+        return np.searchsorted(self._sorted, value, side='left') / self._n * 100
\ No newline at end of file
@@ -20,9 +20,9 @@ def setup_logger(name: str, log_file: str = None, level=logging.INFO):
         datefmt='%Y-%m-%d %H:%M:%S'
     )
     
-    # Console handler
+    # Console handler - stdout is already UTF-8 on Python 3.7+, so no need
+    # to re-open the fd into a second line-buffered stream
     console_handler = logging.StreamHandler(sys.stdout)
-    console_handler.stream = open(sys.stdout.fileno(), mode='w', encoding='utf-8', buffering=1)
     console_handler.setFormatter(formatter)
     logger.addHandler(console_handler)
     
@@ -5,11 +5,11 @@ Interactive dashboard for portfolio recommendations and company health analysis
 
 import streamlit as st
 import pandas as pd
-import plotly.express as px
-import plotly.graph_objects as go
-from plotly.subplots import make_subplots
+import numpy as np
 import sys
 import os
+import time
+from concurrent.futures import ThreadPoolExecutor
 import streamlit as st
 from datetime import datetime
 import os
@@ -19,9 +19,8 @@ from datetime import datetime
 import os
 import sys
 
-from src.models.health_scorer import CompanyHealthScorer
-from src.models.portfolio_ranker import PortfolioRanker
-from src.utils.helpers import format_market_cap
+from src.utils.helpers import (as_categorical, format_market_cap,
+                              format_market_caps, read_df)
 
 
 # Page configuration
@@ -32,64 +31,220 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
-# Custom CSS
-st.markdown("""
-<style>
-    .main-header {
-        font-size: 3rem;
-        font-weight: bold;
-        color: #1f77b4;
-        text-align: center;
-        padding: 1rem 0;
-    }
-    .metric-card {
-        background-color: #f0f2f6;
-        padding: 1rem;
-        border-radius: 0.5rem;
-        margin: 0.5rem 0;
-    }
-    .success-box {
-        background-color: #d4edda;
-        border-left: 5px solid #28a745;
-        padding: 1rem;
-        margin: 1rem 0;
-    }
-    .warning-box {
-        background-color: #fff3cd;
-        border-left: 5px solid #ffc107;
-        padding: 1rem;
-        margin: 1rem 0;
-    }
-    .danger-box {
-        background-color: #f8d7da;
-        border-left: 5px solid #dc3545;
-        padding: 1rem;
-        margin: 1rem 0;
-    }
-</style>
-""", unsafe_allow_html=True)
+# Custom CSS - kept in static/style.css; the cached read means reruns
+# re-emit the style element (Streamlit drops elements that are not
+# re-emitted) without touching the disk again
+@st.cache_data
+def _css():
+    """Stylesheet contents, read once per server process"""
+    with open('static/style.css') as f:
+        return f.read()
+
+st.markdown(f"<style>{_css()}</style>", unsafe_allow_html=True)
+
+# Heavy singletons - cache_resource shares one instance across every
+# session of the server instead of re-parsing the dataset per session
+@st.cache_resource
+def get_scorer():
+    """Shared CompanyHealthScorer instance"""
+    from src.models.health_scorer import CompanyHealthScorer
+    return CompanyHealthScorer()
+
+@st.cache_resource
+def get_ranker():
+    """Shared PortfolioRanker instance"""
+    from src.models.portfolio_ranker import get_portfolio_ranker
+    return get_portfolio_ranker()
 
-# Initialize session state
-if 'health_scorer' not in st.session_state:
-    st.session_state.health_scorer = CompanyHealthScorer()
-if 'portfolio_ranker' not in st.session_state:
-    st.session_state.portfolio_ranker = PortfolioRanker()
+# Columns the dashboard pages actually touch; column pushdown keeps the
+# unused engineered features out of memory entirely
+_APP_COLUMNS = [
+    'symbol', 'company_name', 'sector_category', 'market_cap',
+    'composite_score', 'quality_score', 'value_score', 'growth_score',
+    'risk_score', 'risk_category', 'profitability_status', 'is_profitable',
+]
 
 # Load data
-@st.cache_data
-def load_data():
-    """Load the main dataset"""
-    return pd.read_csv('data/processed/stock_universe_engineered.csv')
+def _data_mtime():
+    """mtime of whichever dataset file read_df will pick"""
+    stem = 'data/processed/stock_universe_engineered'
+    for ext in ('.parquet', '.csv'):
+        if os.path.exists(stem + ext):
+            return os.path.getmtime(stem + ext)
+    return None
 
-@st.cache_data
+@st.cache_data(ttl=3600, persist="disk")
+def load_data(columns=None, mtime=None):
+    """Load the main dataset (Parquet preferred over legacy CSV)
+
+    columns limits the read to the requested subset - Parquet never
+    materializes the rest. mtime is part of the cache key, so edits to
+    the dataset invalidate the cache before the hourly TTL expires.
+
+    Display needs no float64 precision, so numeric columns shrink to
+    float32 and the label columns become categoricals - roughly half
+    the resident memory and half the Arrow bytes per st.dataframe.
+    """
+    df = read_df('data/processed/stock_universe_engineered', columns=columns)
+    float_cols = df.select_dtypes('float64').columns
+    df[float_cols] = df[float_cols].astype('float32')
+    if 'is_profitable' in df.columns:
+        df['is_profitable'] = df['is_profitable'].astype(bool)
+    return as_categorical(df)
+
+# Freshness tiers for the sidebar data status: (max age seconds, css
+# class, label)
+_FRESHNESS_LEVELS = (
+    (86_400, 'success-box', '🟢 Data updated today'),
+    (7 * 86_400, 'warning-box', '🟡 Data up to a week old'),
+)
+
+@st.cache_data(ttl=60)
+def get_data_file_status(mtime=None):
+    """(css_class, label) for the dataset's freshness
+
+    Works from the mtime the caller already has - no extra stat calls
+    or datetime objects per rerun - and re-evaluates once a minute.
+    """
+    if mtime is None:
+        return 'danger-box', '🔴 Dataset missing'
+    age = time.time() - mtime
+    stamp = time.strftime('%b %d, %I:%M %p', time.localtime(mtime))
+    for limit, css_class, label in _FRESHNESS_LEVELS:
+        if age < limit:
+            return css_class, f'{label} ({stamp})'
+    return 'danger-box', f'🔴 Data more than a week old ({stamp})'
+
+@st.cache_data(ttl=3600)
+def score_histogram(mtime=None):
+    """Pre-binned composite-score distribution, keyed on dataset mtime"""
+    df = load_data(_APP_COLUMNS, mtime)
+    return np.histogram(df['composite_score'].dropna().to_numpy(),
+                        bins=20, range=(0, 100))
+
+@st.cache_data(ttl=3600)
+def get_symbols(mtime=None):
+    """Sorted symbol tuple for the health-checker picker
+
+    Projects just the symbol column, so the picker never pulls the rest
+    of the frame.
+    """
+    return tuple(sorted(load_data(['symbol'], mtime)['symbol'].unique()))
+
+@st.cache_data(ttl=3600)
+def symbols_html(mtime=None):
+    """Pre-rendered symbol list for the Available Symbols expander"""
+    return ('<span style="font-family:monospace">'
+            + ', '.join(get_symbols(mtime)) + '</span>')
+
+@st.cache_data(ttl=3600)
+def sector_performance(mtime=None):
+    """Per-sector aggregates, keyed on dataset mtime
+
+    observed=True aggregates over the categorical codes actually present
+    and sort=False skips the group-key sort the later score sort would
+    discard anyway.
+    """
+    df = load_data(_APP_COLUMNS, mtime)
+    stats = df.groupby('sector_category', sort=False, observed=True).agg(
+        **{'Avg Score': ('composite_score', 'mean'),
+           'Total Market Cap': ('market_cap', 'sum'),
+           'Count': ('symbol', 'count')}
+    ).round(2)
+    return stats.sort_values('Avg Score', ascending=False)
+
+@st.cache_data(ttl=3600)
+def compute_dashboard_stats(mtime=None):
+    """Headline dashboard aggregates, keyed on the dataset mtime
+
+    Pure reductions over the cached frame; caching them spares four
+    pandas passes (plus the top-10 selection) on every widget rerun.
+    """
+    df = load_data(_APP_COLUMNS, mtime)
+    # O(n) argpartition picks the winners, then only those ten get sorted
+    scores = df['composite_score'].to_numpy()
+    k = min(10, len(scores))
+    idx = np.argpartition(-scores, k - 1)[:k]
+    idx = idx[np.argsort(-scores[idx], kind='stable')]
+    top10 = df.iloc[idx][
+        ['symbol', 'company_name', 'composite_score', 'sector_category']
+    ]
+    return (len(df), df['composite_score'].mean(),
+            int(df['is_profitable'].sum()),
+            int((df['quality_score'] > 70).sum()), top10)
+
+@st.cache_data(ttl=900, show_spinner=False)
+def analyze_symbol(symbol):
+    """Cached per-symbol health analysis from the shared scorer
+
+    The scorer never appears in the arguments, so Streamlit only hashes
+    the symbol string; re-querying a symbol is a cache hit.
+    """
+    return get_scorer().analyze_company(symbol)
+
+@st.cache_resource
+def _rankings_future():
+    """Background ranking pass, submitted once per server process
+
+    Kicked off from main() on the first script run, so the work overlaps
+    with whatever page the user reads first; by the time they open the
+    Portfolio page, result() is usually an instant lookup.
+    """
+    executor = ThreadPoolExecutor(max_workers=1)
+    return executor.submit(lambda: get_ranker().rank_all_categories())
+
+@st.cache_data(ttl=900, show_spinner=False)
+def health_metric_specs(symbol):
+    """Preformatted (label, value) pairs for a symbol's key metrics
+
+    Keyed on the symbol like analyze_symbol, so reruns re-emit cached
+    strings instead of redoing the percentage math and formatting.
+    """
+    metrics = analyze_symbol(symbol)['key_metrics']
+    specs = [
+        ("Current Price", f"${metrics['current_price']:.2f}"),
+        ("Profit Margin", f"{metrics['profit_margin']*100:.2f}%"),
+        ("Revenue Growth", f"{metrics['revenue_growth']*100:.2f}%"),
+        ("Debt/Equity", f"{metrics['debt_to_equity']:.2f}"
+         if metrics['debt_to_equity'] else None),
+        ("P/E Ratio", f"{metrics['pe_ratio']:.2f}"
+         if metrics['pe_ratio'] else None),
+        ("ROE", f"{metrics['roe']*100:.2f}%"
+         if metrics['roe'] else None),
+        ("Beta", f"{metrics['beta']:.2f}"
+         if metrics['beta'] else None),
+        ("Dividend Yield", f"{metrics['dividend_yield']*100:.2f}%"
+         if metrics['dividend_yield'] else None),
+    ]
+    return [(label, value) for label, value in specs if value is not None]
+
+@st.cache_data(ttl=3600, show_spinner=False, persist="disk")
 def load_portfolio_results():
-    """Load portfolio ranking results"""
-    ranker = PortfolioRanker()
-    return ranker.rank_all_categories()
+    """Load portfolio ranking results from the shared ranker instance"""
+    return _rankings_future().result()
+
+def render_metric_grid(specs, n_cols=3):
+    """Lay out precomputed (label, value) metric pairs across columns
+
+    One st.columns call plus a tight loop, instead of a with-block per
+    column; the values arrive already formatted.
+    """
+    cols = st.columns(n_cols)
+    for i, (label, value) in enumerate(specs):
+        cols[i % n_cols].metric(label, value)
 
 def create_health_gauge(score, title="Health Score"):
     """Create a gauge chart for health score"""
-    
+    import plotly.graph_objects as go
+    # The cache stores the plain dict form - far cheaper to pickle than
+    # a Figure - and each caller gets its own Figure wrapped around it
+    return go.Figure(_health_gauge_dict(score, title))
+
+@st.cache_data(show_spinner=False)
+def _health_gauge_dict(score, title):
+    """Cached gauge spec, keyed on the scalar inputs"""
+    import plotly.graph_objects as go
+
     # Determine color based on score
     if score >= 70:
         color = "green"
@@ -124,13 +279,20 @@ def create_health_gauge(score, title="Health Score"):
     ))
     
     fig.update_layout(height=300)
-    return fig
+    return fig.to_dict()
 
 def create_dimension_radar(dimensions):
     """Create radar chart for health dimensions"""
-    
-    categories = list(dimensions.keys())
-    values = list(dimensions.values())
+    # Dicts don't key a cache; hand the helper a hashable tuple
+    return _dimension_radar(tuple(dimensions.items()))
+
+@st.cache_data(show_spinner=False)
+def _dimension_radar(items):
+    """Cached radar build from (dimension, value) pairs"""
+    import plotly.graph_objects as go
+
+    categories = [name for name, _ in items]
+    values = [value for _, value in items]
     
     fig = go.Figure()
     
@@ -155,16 +317,29 @@ def create_dimension_radar(dimensions):
     return fig
 
 def create_portfolio_chart(df, top_n=10):
-    """Create bar chart for top picks"""
-    
+    """Create bar chart for top picks (capped at 50 bars)"""
+    # Past ~50 bars the labels are unreadable and the SVG render slows;
+    # cap regardless of how large the ranked frame grows
+    top_n = min(top_n, 50)
     top_picks = df.head(top_n)
-    
+    # Key the cache on the two plotted columns instead of hashing the
+    # whole frame
+    return _portfolio_chart(tuple(top_picks['symbol']),
+                            tuple(top_picks['rank_score']), top_n)
+
+@st.cache_data(show_spinner=False)
+def _portfolio_chart(symbols, scores, top_n):
+    """Cached bar-chart build from symbol/score tuples"""
+    import plotly.graph_objects as go
+
+    scores = np.asarray(scores)
+
     fig = go.Figure()
     
     fig.add_trace(go.Bar(
-        x=top_picks['symbol'],
-        y=top_picks['rank_score'],
-        text=top_picks['rank_score'].round(2),
+        x=symbols,
+        y=scores,
+        text=scores.round(2),
         textposition='auto',
         marker_color='#1f77b4',
         hovertemplate='<b>%{x}</b><br>Score: %{y:.2f}<extra></extra>'
@@ -180,508 +355,555 @@ def create_portfolio_chart(df, top_n=10):
     
     return fig
 
-def main():
-    """Main application"""
-    
-    # Header
-    st.markdown('<p class="main-header">📈 HNI Investment Intelligence Platform</p>', unsafe_allow_html=True)
-    st.markdown("### AI-Powered Stock Analysis & Portfolio Recommendations")
+def show_dashboard():
+    """Executive dashboard page"""
+    import plotly.express as px
+    import plotly.graph_objects as go
+
+    st.header("📊 Executive Dashboard")
     
-    # Sidebar navigation
-    st.sidebar.title("🎯 Navigation")
-    page = st.sidebar.radio(
-        "Select Page",
-        ["🏠 Dashboard", "🏆 Portfolio Recommendations", "🏥 Company Health Checker", "📊 Market Overview", "ℹ️ About"]
+    # Key metrics - aggregates come precomputed from the cache
+    n_companies, avg_score, profitable, high_quality, top10 = (
+        compute_dashboard_stats(_data_mtime())
     )
+    col1, col2, col3, col4 = st.columns(4)
     
-    # Load data
-    df = load_data()
+    with col1:
+        st.metric("Total Companies", n_companies)
+    with col2:
+        st.metric("Avg Health Score", f"{avg_score:.1f}%")
+    with col3:
+        st.metric("Profitable", f"{profitable} ({profitable/n_companies*100:.0f}%)")
+    with col4:
+        st.metric("High Quality", high_quality)
     
-    # PAGE 1: DASHBOARD
-    if page == "🏠 Dashboard":
-        st.header("📊 Executive Dashboard")
-        
-        # Key metrics
-        col1, col2, col3, col4 = st.columns(4)
-        
-        with col1:
-            st.metric("Total Companies", len(df))
-        with col2:
-            st.metric("Avg Health Score", f"{df['composite_score'].mean():.1f}%")
-        with col3:
-            profitable = df['is_profitable'].sum()
-            st.metric("Profitable", f"{profitable} ({profitable/len(df)*100:.0f}%)")
-        with col4:
-            high_quality = (df['quality_score'] > 70).sum()
-            st.metric("High Quality", high_quality)
-        
-        st.markdown("---")
-        
-        # Quick stats
-        col1, col2 = st.columns(2)
-        
-        with col1:
-            st.subheader("📈 Top 10 Overall Picks")
-            top10 = df.nlargest(10, 'composite_score')[['symbol', 'company_name', 'composite_score', 'sector_category']]
-            st.dataframe(
-                top10.style.format({'composite_score': '{:.2f}'}),
-                use_container_width=True,
-                hide_index=True
-            )
-        
-        with col2:
-            st.subheader("🎯 Score Distribution")
-            fig = px.histogram(
-                df, 
-                x='composite_score', 
-                nbins=20,
-                title="Composite Score Distribution",
-                labels={'composite_score': 'Composite Score', 'count': 'Number of Companies'}
-            )
-            st.plotly_chart(fig, use_container_width=True)
-        
-        # Sector breakdown
-        st.subheader("🏢 Sector Performance")
-        sector_stats = df.groupby('sector_category').agg({
-            'composite_score': 'mean',
-            'market_cap': 'sum',
-            'symbol': 'count'
-        }).round(2)
-        sector_stats.columns = ['Avg Score', 'Total Market Cap', 'Count']
-        sector_stats = sector_stats.sort_values('Avg Score', ascending=False)
-        
-        col1, col2 = st.columns(2)
-        
-        with col1:
-            fig = px.bar(
-                sector_stats.reset_index(),
-                x='sector_category',
-                y='Avg Score',
-                title="Average Score by Sector"
-            )
-            st.plotly_chart(fig, use_container_width=True)
-        
-        with col2:
-            st.dataframe(sector_stats, use_container_width=True)
+    st.markdown("---")
     
-    # PAGE 2: PORTFOLIO RECOMMENDATIONS
-    elif page == "🏆 Portfolio Recommendations":
-        st.header("🏆 Investment Portfolio Recommendations")
-        
-        st.info("📌 AI-powered rankings across 4 market cap categories with detailed analysis")
-        
-        # Load portfolio results
-        with st.spinner("Generating portfolio recommendations..."):
-            results = load_portfolio_results()
-        
-        # Category selector
-        category = st.selectbox(
-            "Select Category",
-            ["Magnificent 7", "Giant Cap (>$500B)", "Large Cap ($100B-$500B)", "Mid Cap (<$100B)", "Overall Top 20"]
-        )
-        
-        # Map selection to key
-        category_map = {
-            "Magnificent 7": "mag7",
-            "Giant Cap (>$500B)": "giant",
-            "Large Cap ($100B-$500B)": "large",
-            "Mid Cap (<$100B)": "mid",
-            "Overall Top 20": "overall_top20"
-        }
-        
-        cat_key = category_map[category]
-        cat_result = results[cat_key]
-        
-        # Display statistics
-        st.subheader(f"📊 {category} - Statistics")
-        
-        col1, col2, col3, col4 = st.columns(4)
-        
-        stats = cat_result['statistics']
-        
-        with col1:
-            st.metric("Total Companies", cat_result['total_companies'])
-        with col2:
-            st.metric("Avg Composite Score", f"{stats['avg_composite_score']:.2f}")
-        with col3:
-            st.metric("Total Market Cap", format_market_cap(stats['total_market_cap']))
-        with col4:
-            st.metric("Profitable", f"{stats['profitable_pct']:.0f}%")
-        
-        # Risk distribution
-        st.subheader("⚠️ Risk Distribution")
-        risk_data = pd.DataFrame({
-            'Risk Level': ['Low Risk', 'Medium Risk', 'High Risk'],
-            'Percentage': [stats['low_risk_pct'], stats['medium_risk_pct'], stats['high_risk_pct']]
-        })
-        
-        fig = px.pie(risk_data, values='Percentage', names='Risk Level', 
-                     color_discrete_sequence=['green', 'yellow', 'red'])
-        st.plotly_chart(fig, use_container_width=True)
-        
-        # Top picks chart
-        st.subheader(f"🎯 Top {cat_result['top_n']} Recommendations")
-        
-        fig = create_portfolio_chart(cat_result['top_picks'], cat_result['top_n'])
-        st.plotly_chart(fig, use_container_width=True)
-        
-        # Detailed table
-        st.subheader("📋 Detailed Rankings")
-        
-        display_df = cat_result['top_picks'][[
-            'rank', 'symbol', 'company_name', 'rank_score', 
-            'quality_score', 'value_score', 'growth_score', 
-            'market_cap', 'risk_category'
-        ]].copy()
-        
-        display_df['market_cap'] = display_df['market_cap'].apply(lambda x: format_market_cap(x))
-        
+    # Quick stats
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        st.subheader("📈 Top 10 Overall Picks")
+        # Plain frame + column_config keeps the Arrow fast path; a
+        # Styler would rebuild per-cell HTML on every rerun
         st.dataframe(
-            display_df.style.format({
-                'rank_score': '{:.2f}',
-                'quality_score': '{:.2f}',
-                'value_score': '{:.2f}',
-                'growth_score': '{:.2f}'
-            }),
+            top10,
+            column_config={
+                'composite_score': st.column_config.NumberColumn(format='%.2f'),
+            },
             use_container_width=True,
             hide_index=True
         )
-        
-        # Top 3 analysis
-        st.subheader("🔍 Detailed Analysis - Top 3")
-        
-        for i, (_, row) in enumerate(cat_result['top_picks'].head(3).iterrows(), 1):
-            with st.expander(f"#{i} - {row['symbol']} - {row['company_name']}"):
-                col1, col2, col3 = st.columns(3)
-                
-                with col1:
-                    st.metric("Rank Score", f"{row['rank_score']:.2f}")
-                    st.metric("Market Cap", format_market_cap(row['market_cap']))
-                
-                with col2:
-                    st.metric("P/E Ratio", f"{row.get('pe_ratio', 'N/A'):.2f}" if pd.notna(row.get('pe_ratio')) else "N/A")
-                    st.metric("Profit Margin", f"{row['profit_margin']*100:.2f}%")
-                
-                with col3:
-                    st.metric("Revenue Growth", f"{row['revenue_growth']*100:.2f}%")
-                    st.metric("Risk", row['risk_category'])
-                
-                # Score breakdown
-                score_data = pd.DataFrame({
-                    'Dimension': ['Quality', 'Value', 'Growth', 'Momentum'],
-                    'Score': [row['quality_score'], row['value_score'], 
-                             row['growth_score'], row['momentum_score']]
-                })
-                
-                fig = px.bar(score_data, x='Dimension', y='Score', 
-                            title="Score Breakdown")
-                st.plotly_chart(fig, use_container_width=True)
     
-    # PAGE 3: COMPANY HEALTH CHECKER
-    elif page == "🏥 Company Health Checker":
-        st.header("🏥 Company Health Analysis")
-        
-        st.info("📌 Enter a stock symbol to get instant health analysis with AI-generated insights")
-        
-        # Symbol input
-        col1, col2 = st.columns([3, 1])
-        
-        with col1:
-            symbol_input = st.text_input(
-                "Enter Stock Symbol",
-                placeholder="e.g., NVDA, AAPL, MSFT",
-                help="Enter a ticker symbol from the analyzed universe"
-            ).upper()
-        
-        with col2:
-            analyze_button = st.button("🔍 Analyze", type="primary", use_container_width=True)
-        
-        # Available symbols
-        with st.expander("📋 Available Symbols"):
-            symbols_list = sorted(df['symbol'].unique())
-            st.write(", ".join(symbols_list))
-        
-        # Perform analysis
-        if analyze_button and symbol_input:
-            with st.spinner(f"Analyzing {symbol_input}..."):
-                scorer = st.session_state.health_scorer
-                analysis = scorer.analyze_company(symbol_input)
+    with col2:
+        st.subheader("🎯 Score Distribution")
+        # Bin server-side so the browser gets 20 bars instead of
+        # every raw score to bin client-side
+        counts, edges = score_histogram(_data_mtime())
+        fig = go.Figure(go.Bar(
+            x=(edges[:-1] + edges[1:]) / 2,
+            y=counts,
+            width=np.diff(edges),
+        ))
+        fig.update_layout(
+            title="Composite Score Distribution",
+            xaxis_title='Composite Score',
+            yaxis_title='Number of Companies',
+        )
+        st.plotly_chart(fig, use_container_width=True, key='dash_hist')
+    
+    # Sector breakdown - aggregated once per dataset version
+    st.subheader("🏢 Sector Performance")
+    sector_stats = sector_performance(_data_mtime())
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        fig = px.bar(
+            sector_stats.reset_index(),
+            x='sector_category',
+            y='Avg Score',
+            title="Average Score by Sector"
+        )
+        st.plotly_chart(fig, use_container_width=True, key='dash_sector')
+    
+    with col2:
+        st.dataframe(sector_stats, use_container_width=True)
+
+def show_portfolio():
+    """Portfolio recommendations page"""
+    import plotly.express as px
+
+    st.header("🏆 Investment Portfolio Recommendations")
+    
+    st.info("📌 AI-powered rankings across 4 market cap categories with detailed analysis")
+    
+    # Load portfolio results
+    with st.spinner("Generating portfolio recommendations..."):
+        results = load_portfolio_results()
+    
+    # Category selector
+    category = st.selectbox(
+        "Select Category",
+        ["Magnificent 7", "Giant Cap (>$500B)", "Large Cap ($100B-$500B)", "Mid Cap (<$100B)", "Overall Top 20"]
+    )
+    
+    # Map selection to key
+    category_map = {
+        "Magnificent 7": "mag7",
+        "Giant Cap (>$500B)": "giant",
+        "Large Cap ($100B-$500B)": "large",
+        "Mid Cap (<$100B)": "mid",
+        "Overall Top 20": "overall_top20"
+    }
+    
+    cat_key = category_map[category]
+    cat_result = results[cat_key]
+    
+    # Display statistics
+    st.subheader(f"📊 {category} - Statistics")
+    
+    col1, col2, col3, col4 = st.columns(4)
+    
+    stats = cat_result['statistics']
+    
+    with col1:
+        st.metric("Total Companies", cat_result['total_companies'])
+    with col2:
+        st.metric("Avg Composite Score", f"{stats['avg_composite_score']:.2f}")
+    with col3:
+        st.metric("Total Market Cap", format_market_cap(stats['total_market_cap']))
+    with col4:
+        st.metric("Profitable", f"{stats['profitable_pct']:.0f}%")
+    
+    # Risk distribution
+    st.subheader("⚠️ Risk Distribution")
+    risk_data = pd.DataFrame({
+        'Risk Level': ['Low Risk', 'Medium Risk', 'High Risk'],
+        'Percentage': [stats['low_risk_pct'], stats['medium_risk_pct'], stats['high_risk_pct']]
+    })
+    
+    fig = px.pie(risk_data, values='Percentage', names='Risk Level', 
+                 color_discrete_sequence=['green', 'yellow', 'red'])
+    st.plotly_chart(fig, use_container_width=True, key='port_risk_pie')
+    
+    # Top picks chart
+    st.subheader(f"🎯 Top {cat_result['top_n']} Recommendations")
+    
+    fig = create_portfolio_chart(cat_result['top_picks'], cat_result['top_n'])
+    st.plotly_chart(fig, use_container_width=True, key='port_top_picks')
+    
+    # Detailed table
+    st.subheader("📋 Detailed Rankings")
+    
+    display_df = cat_result['top_picks'][[
+        'rank', 'symbol', 'company_name', 'rank_score', 
+        'quality_score', 'value_score', 'growth_score', 
+        'market_cap', 'risk_category'
+    ]].copy()
+    
+    # column_config formats client-side, so the score columns stay
+    # numeric in the Arrow payload; market_cap keeps its T/B suffix
+    # string since printf formats cannot express it
+    display_df['market_cap'] = format_market_caps(display_df['market_cap'])
+    
+    st.dataframe(
+        display_df,
+        column_config={
+            'rank_score': st.column_config.NumberColumn(format='%.2f'),
+            'quality_score': st.column_config.NumberColumn(format='%.2f'),
+            'value_score': st.column_config.NumberColumn(format='%.2f'),
+            'growth_score': st.column_config.NumberColumn(format='%.2f'),
+        },
+        use_container_width=True,
+        hide_index=True
+    )
+    
+    # Top 3 analysis
+    st.subheader("🔍 Detailed Analysis - Top 3")
+    
+    # itertuples emits C-level namedtuples instead of building a Series
+    # (with dtype upcasting) per row
+    for i, row in enumerate(cat_result['top_picks'].head(3).itertuples(index=False), 1):
+        with st.expander(f"#{i} - {row.symbol} - {row.company_name}"):
+            pe_ratio = getattr(row, 'pe_ratio', None)
+            render_metric_grid([
+                ("Rank Score", f"{row.rank_score:.2f}"),
+                ("P/E Ratio", f"{pe_ratio:.2f}" if pd.notna(pe_ratio) else "N/A"),
+                ("Revenue Growth", f"{row.revenue_growth*100:.2f}%"),
+                ("Market Cap", format_market_cap(row.market_cap)),
+                ("Profit Margin", f"{row.profit_margin*100:.2f}%"),
+                ("Risk", row.risk_category),
+            ])
             
-            if 'error' in analysis:
-                st.error(f"❌ {analysis['error']}")
-            else:
-                # Success - display results
-                st.success(f"✅ Analysis complete for {analysis['company_name']}")
-                
-                # Overall health score
-                st.subheader("🎯 Overall Health Assessment")
-                
-                col1, col2, col3 = st.columns([2, 1, 1])
-                
-                with col1:
-                    fig = create_health_gauge(analysis['overall_health'])
-                    st.plotly_chart(fig, use_container_width=True)
-                
-                with col2:
-                    st.metric("Risk Level", analysis['risk_level'])
-                    st.metric("Sector", analysis['sector'].replace('_', ' ').title())
-                
-                with col3:
-                    st.metric("Market Cap", format_market_cap(analysis['market_cap']))
-                    
-                    # Recommendation color coding
-                    rec = analysis['recommendation']
-                    if 'Buy' in rec or 'Strong' in rec:
-                        st.markdown(f'<div class="success-box"><b>Recommendation:</b><br>{rec}</div>', unsafe_allow_html=True)
-                    elif 'Hold' in rec:
-                        st.markdown(f'<div class="warning-box"><b>Recommendation:</b><br>{rec}</div>', unsafe_allow_html=True)
-                    else:
-                        st.markdown(f'<div class="danger-box"><b>Recommendation:</b><br>{rec}</div>', unsafe_allow_html=True)
-                
-                # Dimension scores
-                st.subheader("📊 Health Dimensions")
-                
-                col1, col2 = st.columns(2)
-                
-                with col1:
-                    # Radar chart
-                    fig = create_dimension_radar(analysis['dimension_scores'])
-                    st.plotly_chart(fig, use_container_width=True)
-                
-                with col2:
-                    # Dimension table
-                    dim_df = pd.DataFrame({
-                        'Dimension': [k.replace('_', ' ').title() for k in analysis['dimension_scores'].keys()],
-                        'Score': list(analysis['dimension_scores'].values())
-                    })
-                    
-                    fig = px.bar(dim_df, x='Score', y='Dimension', orientation='h',
-                                title="Dimension Scores")
-                    st.plotly_chart(fig, use_container_width=True)
-                
-                # Key metrics
-                st.subheader("💰 Key Financial Metrics")
-                
-                metrics = analysis['key_metrics']
-                
-                col1, col2, col3, col4 = st.columns(4)
-                
-                with col1:
-                    st.metric("Current Price", f"${metrics['current_price']:.2f}")
-                    if metrics['pe_ratio']:
-                        st.metric("P/E Ratio", f"{metrics['pe_ratio']:.2f}")
-                
-                with col2:
-                    st.metric("Profit Margin", f"{metrics['profit_margin']*100:.2f}%")
-                    if metrics['roe']:
-                        st.metric("ROE", f"{metrics['roe']*100:.2f}%")
-                
-                with col3:
-                    st.metric("Revenue Growth", f"{metrics['revenue_growth']*100:.2f}%")
-                    if metrics['beta']:
-                        st.metric("Beta", f"{metrics['beta']:.2f}")
-                
-                with col4:
-                    if metrics['debt_to_equity']:
-                        st.metric("Debt/Equity", f"{metrics['debt_to_equity']:.2f}")
-                    if metrics['dividend_yield']:
-                        st.metric("Dividend Yield", f"{metrics['dividend_yield']*100:.2f}%")
-                
-                # Pros and Cons
-                col1, col2 = st.columns(2)
+            # Score breakdown
+            score_data = pd.DataFrame({
+                'Dimension': ['Quality', 'Value', 'Growth', 'Momentum'],
+                'Score': [row.quality_score, row.value_score, 
+                         row.growth_score, row.momentum_score]
+            })
+            
+            fig = px.bar(score_data, x='Dimension', y='Score', 
+                        title="Score Breakdown")
+            st.plotly_chart(fig, use_container_width=True, key=f'port_breakdown_{row.symbol}')
+
+def show_health_checker():
+    """Company health checker page"""
+    import plotly.express as px
+
+    st.header("🏥 Company Health Analysis")
+    
+    st.info("📌 Enter a stock symbol to get instant health analysis with AI-generated insights")
+    
+    # Symbol input
+    col1, col2 = st.columns([3, 1])
+    
+    with col1:
+        symbol_input = st.text_input(
+            "Enter Stock Symbol",
+            placeholder="e.g., NVDA, AAPL, MSFT",
+            help="Enter a ticker symbol from the analyzed universe"
+        ).upper()
+    
+    with col2:
+        analyze_button = st.button("🔍 Analyze", type="primary", use_container_width=True)
+    
+    # Available symbols
+    with st.expander("📋 Available Symbols"):
+        # The joined blob is cached; the markdown pipeline gets one
+        # prebuilt HTML span instead of re-joining 100+ strings
+        st.markdown(symbols_html(_data_mtime()), unsafe_allow_html=True)
+    
+    # Perform analysis
+    if analyze_button and symbol_input:
+        with st.spinner(f"Analyzing {symbol_input}..."):
+            analysis = analyze_symbol(symbol_input)
+        
+        if 'error' in analysis:
+            st.error(f"❌ {analysis['error']}")
+        else:
+            # Success - display results
+            st.success(f"✅ Analysis complete for {analysis['company_name']}")
+            
+            # Overall health score
+            st.subheader("🎯 Overall Health Assessment")
+            
+            col1, col2, col3 = st.columns([2, 1, 1])
+            
+            with col1:
+                fig = create_health_gauge(analysis['overall_health'])
+                st.plotly_chart(fig, use_container_width=True, key='health_gauge')
+            
+            with col2:
+                st.metric("Risk Level", analysis['risk_level'])
+                st.metric("Sector", analysis['sector'].replace('_', ' ').title())
+            
+            with col3:
+                st.metric("Market Cap", format_market_cap(analysis['market_cap']))
                 
-                with col1:
-                    st.subheader("✅ Strengths (Pros)")
-                    for pro in analysis['pros']:
-                        st.markdown(f"- ✓ {pro}")
+                # Recommendation color coding
+                rec = analysis['recommendation']
+                if 'Buy' in rec or 'Strong' in rec:
+                    st.markdown(f'<div class="success-box"><b>Recommendation:</b><br>{rec}</div>', unsafe_allow_html=True)
+                elif 'Hold' in rec:
+                    st.markdown(f'<div class="warning-box"><b>Recommendation:</b><br>{rec}</div>', unsafe_allow_html=True)
+                else:
+                    st.markdown(f'<div class="danger-box"><b>Recommendation:</b><br>{rec}</div>', unsafe_allow_html=True)
+            
+            # Dimension scores
+            st.subheader("📊 Health Dimensions")
+            
+            col1, col2 = st.columns(2)
+            
+            with col1:
+                # Radar chart
+                fig = create_dimension_radar(analysis['dimension_scores'])
+                st.plotly_chart(fig, use_container_width=True, key='health_radar')
+            
+            with col2:
+                # Dimension table
+                dim_df = pd.DataFrame({
+                    'Dimension': [k.replace('_', ' ').title() for k in analysis['dimension_scores'].keys()],
+                    'Score': list(analysis['dimension_scores'].values())
+                })
                 
-                with col2:
-                    st.subheader("⚠️ Concerns (Cons)")
-                    for con in analysis['cons']:
-                        st.markdown(f"- ⚠ {con}")
-    
-    # PAGE 4: MARKET OVERVIEW
-    elif page == "📊 Market Overview":
-        st.header("📊 Market Overview")
-        
-        st.info("📌 Comprehensive view of the analyzed universe with interactive visualizations")
-        
-        # Filters
-        st.subheader("🔍 Filters")
-        
-        col1, col2, col3 = st.columns(3)
-        
-        with col1:
-            sector_filter = st.multiselect(
-                "Sector",
-                options=sorted(df['sector_category'].unique()),
-                default=None
-            )
-        
-        with col2:
-            risk_filter = st.multiselect(
-                "Risk Level",
-                options=['Low Risk', 'Medium Risk', 'High Risk'],
-                default=None
-            )
-        
-        with col3:
-            profitability_filter = st.multiselect(
-                "Profitability",
-                options=sorted(df['profitability_status'].unique()),
-                default=None
-            )
-        
-        # Apply filters
-        filtered_df = df.copy()
-        
-        if sector_filter:
-            filtered_df = filtered_df[filtered_df['sector_category'].isin(sector_filter)]
-        if risk_filter:
-            filtered_df = filtered_df[filtered_df['risk_category'].isin(risk_filter)]
-        if profitability_filter:
-            filtered_df = filtered_df[filtered_df['profitability_status'].isin(profitability_filter)]
-        
-        st.write(f"**Showing {len(filtered_df)} companies**")
-        
-        # Scatter plot
-        st.subheader("💹 Quality vs Value Analysis")
-        
-        fig = px.scatter(
-            filtered_df,
-            x='value_score',
-            y='quality_score',
-            size='market_cap',
-            color='risk_category',
-            hover_data=['symbol', 'company_name', 'composite_score'],
-            title="Quality vs Value (bubble size = market cap)",
-            labels={'value_score': 'Value Score', 'quality_score': 'Quality Score'},
-            color_discrete_map={'Low Risk': 'green', 'Medium Risk': 'yellow', 'High Risk': 'red'}
+                fig = px.bar(dim_df, x='Score', y='Dimension', orientation='h',
+                            title="Dimension Scores")
+                st.plotly_chart(fig, use_container_width=True, key='health_dims')
+            
+            # Key metrics
+            st.subheader("💰 Key Financial Metrics")
+            
+            render_metric_grid(health_metric_specs(symbol_input), n_cols=4)
+            
+            # Pros and Cons
+            col1, col2 = st.columns(2)
+            
+            with col1:
+                st.subheader("✅ Strengths (Pros)")
+                for pro in analysis['pros']:
+                    st.markdown(f"- ✓ {pro}")
+            
+            with col2:
+                st.subheader("⚠️ Concerns (Cons)")
+                for con in analysis['cons']:
+                    st.markdown(f"- ⚠ {con}")
+
+@st.cache_data(show_spinner=False)
+def _overview_artifacts(sectors, risks, profits, mtime=None):
+    """Filtered frame plus both overview scatters, keyed on the filters
+
+    Re-toggling back to a previous filter combination is a cache hit, so
+    neither the mask nor the figures' Python dicts get rebuilt.
+    """
+    import plotly.express as px
+
+    df = load_data(_APP_COLUMNS, mtime)
+    # One composed mask: the label columns are categoricals (see
+    # load_data), so isin matches int codes, and a single slice replaces
+    # three intermediate frames
+    mask = np.ones(len(df), dtype=bool)
+    if sectors:
+        mask &= df['sector_category'].isin(sectors).to_numpy()
+    if risks:
+        mask &= df['risk_category'].isin(risks).to_numpy()
+    if profits:
+        mask &= df['profitability_status'].isin(profits).to_numpy()
+    # No active filters means an all-true mask - hand back df itself
+    # rather than allocating an identical copy
+    filtered_df = df[mask] if not mask.all() else df
+
+    # SVG scatters lag past a couple thousand points; switch to WebGL
+    # once the universe outgrows that
+    render_mode = 'webgl' if len(filtered_df) > 2000 else 'auto'
+
+    fig_qv = px.scatter(
+        filtered_df,
+        x='value_score',
+        y='quality_score',
+        render_mode=render_mode,
+        size='market_cap',
+        color='risk_category',
+        hover_data=['symbol', 'company_name', 'composite_score'],
+        title="Quality vs Value (bubble size = market cap)",
+        labels={'value_score': 'Value Score', 'quality_score': 'Quality Score'},
+        color_discrete_map={'Low Risk': 'green', 'Medium Risk': 'yellow', 'High Risk': 'red'}
+    )
+    fig_gr = px.scatter(
+        filtered_df,
+        x='risk_score',
+        y='growth_score',
+        render_mode=render_mode,
+        size='market_cap',
+        color='sector_category',
+        hover_data=['symbol', 'company_name'],
+        title="Growth Potential vs Risk Level",
+        labels={'risk_score': 'Risk Score', 'growth_score': 'Growth Score'}
+    )
+    return filtered_df, fig_qv, fig_gr
+
+@st.fragment
+def show_market_overview():
+    """Market overview page
+
+    A fragment: toggling the filter multiselects reruns only this page
+    body, not the whole script.
+    """
+    df = load_data(_APP_COLUMNS, _data_mtime())
+
+    st.header("📊 Market Overview")
+    
+    st.info("📌 Comprehensive view of the analyzed universe with interactive visualizations")
+    
+    # Filters
+    st.subheader("🔍 Filters")
+    
+    col1, col2, col3 = st.columns(3)
+    
+    with col1:
+        sector_filter = st.multiselect(
+            "Sector",
+            options=sorted(df['sector_category'].unique()),
+            default=None
         )
-        
-        st.plotly_chart(fig, use_container_width=True)
-        
-        # Growth vs Risk
-        st.subheader("📈 Growth vs Risk Analysis")
-        
-        fig = px.scatter(
-            filtered_df,
-            x='risk_score',
-            y='growth_score',
-            size='market_cap',
-            color='sector_category',
-            hover_data=['symbol', 'company_name'],
-            title="Growth Potential vs Risk Level",
-            labels={'risk_score': 'Risk Score', 'growth_score': 'Growth Score'}
+    
+    with col2:
+        risk_filter = st.multiselect(
+            "Risk Level",
+            options=['Low Risk', 'Medium Risk', 'High Risk'],
+            default=None
         )
-        
-        st.plotly_chart(fig, use_container_width=True)
-        
-        # Data table
-        st.subheader("📋 Complete Dataset")
-        
-        display_cols = ['symbol', 'company_name', 'sector_category', 'market_cap',
-                       'composite_score', 'quality_score', 'value_score', 'growth_score',
-                       'risk_category', 'profitability_status']
-        
-        st.dataframe(
-            filtered_df[display_cols].style.format({
-                'market_cap': lambda x: format_market_cap(x),
-                'composite_score': '{:.2f}',
-                'quality_score': '{:.2f}',
-                'value_score': '{:.2f}',
-                'growth_score': '{:.2f}'
-            }),
-            use_container_width=True,
-            hide_index=True
+    
+    with col3:
+        profitability_filter = st.multiselect(
+            "Profitability",
+            options=sorted(df['profitability_status'].unique()),
+            default=None
         )
     
-    # PAGE 5: ABOUT
-    elif page == "ℹ️ About":
-        st.header("ℹ️ About This Platform")
-        
-        st.markdown("""
-        ## 🏆 HNI Investment Intelligence Platform
-        
-        **AI-Powered Stock Analysis & Portfolio Recommendations**
-        
-        ### 📋 Overview
-        
-        This platform provides comprehensive investment analysis for high-net-worth individuals,
-        analyzing 102 major US companies across multiple dimensions to provide data-driven insights.
-        
-        ### ✨ Key Features
-        
-        #### 1. Portfolio Recommendations
-        - **Magnificent 7**: Tech giants analysis
-        - **Giant Cap**: Companies >$500B
-        - **Large Cap**: Companies $100B-$500B
-        - **Mid Cap**: Companies <$100B
-        
-        #### 2. Company Health Checker
-        - 6-dimensional health analysis
-        - AI-generated pros and cons
-        - Risk assessment
-        - Investment recommendations
-        
-        #### 3. Advanced Analytics
-        - 59 engineered features per company
-        - Composite scoring (Quality, Value, Growth, Momentum)
-        - Altman Z-Score for bankruptcy prediction
-        - Sector-relative performance metrics
-        
-        ### 🔧 Technology Stack
-        
-        - **Python 3.12**: Core language
-        - **Streamlit**: Web interface
-        - **Pandas**: Data manipulation
-        - **Plotly**: Interactive visualizations
-        - **yfinance**: Market data
-        
-        ### 📊 Data Coverage
-        
-        - **Companies**: 102 major US stocks
-        - **Sectors**: 11 industry sectors
-        - **Features**: 59 per company
-        - **Update Frequency**: Daily (recommended)
-        
-        ### 🎯 Scoring Methodology
-        
-        **Health Score (0-100%)**:
-        - Financial Strength (25%)
-        - Profitability (20%)
-        - Growth Trajectory (20%)
-        - Valuation (15%)
-        - Risk Management (10%)
-        - Market Position (10%)
-        
-        **Ranking Score**:
-        - Composite Score (30%)
-        - Quality Score (20%)
-        - Growth Score (20%)
-        - Value Score (15%)
-        - Momentum Score (15%)
-        
-        ### ⚠️ Disclaimer
-        
-        This tool is for **educational and informational purposes only**.
-        - Not financial advice
-        - Past performance ≠ future results
-        - Always consult a licensed financial advisor
-        - Conduct your own due diligence
-        
-        ### 📧 Contact
-        
-        Built by: Muhammed Shaheem OP
-        
-        Date: February 2026  
-        Purpose: HNI Investment Platform
-        
-        ---
-        
-        **Version**: 1.0.0  
-        **Last Updated**: February 10, 2026
-        """)
+    filtered_df, fig_qv, fig_gr = _overview_artifacts(
+        tuple(sorted(sector_filter)), tuple(sorted(risk_filter)),
+        tuple(sorted(profitability_filter)), _data_mtime())
+
+    st.write(f"**Showing {len(filtered_df)} companies**")
+
+    # Scatter plot
+    st.subheader("💹 Quality vs Value Analysis")
+    st.plotly_chart(fig_qv, use_container_width=True, key='mkt_quality_value')
+    
+    # Growth vs Risk
+    st.subheader("📈 Growth vs Risk Analysis")
+    st.plotly_chart(fig_gr, use_container_width=True, key='mkt_growth_risk')
+    
+    # Data table
+    st.subheader("📋 Complete Dataset")
+    
+    display_cols = ['symbol', 'company_name', 'sector_category', 'market_cap',
+                   'composite_score', 'quality_score', 'value_score', 'growth_score',
+                   'risk_category', 'profitability_status']
+    
+    table = filtered_df[display_cols].copy()
+    table['market_cap'] = format_market_caps(table['market_cap'])
+    st.dataframe(
+        table,
+        column_config={
+            'composite_score': st.column_config.NumberColumn(format='%.2f'),
+            'quality_score': st.column_config.NumberColumn(format='%.2f'),
+            'value_score': st.column_config.NumberColumn(format='%.2f'),
+            'growth_score': st.column_config.NumberColumn(format='%.2f'),
+        },
+        use_container_width=True,
+        hide_index=True
+    )
+
+def show_about():
+    """About page (static content)"""
+    st.header("ℹ️ About This Platform")
+    
+    st.markdown("""
+    ## 🏆 HNI Investment Intelligence Platform
+    
+    **AI-Powered Stock Analysis & Portfolio Recommendations**
+    
+    ### 📋 Overview
+    
+    This platform provides comprehensive investment analysis for high-net-worth individuals,
+    analyzing 102 major US companies across multiple dimensions to provide data-driven insights.
+    
+    ### ✨ Key Features
+    
+    #### 1. Portfolio Recommendations
+    - **Magnificent 7**: Tech giants analysis
+    - **Giant Cap**: Companies >$500B
+    - **Large Cap**: Companies $100B-$500B
+    - **Mid Cap**: Companies <$100B
+    
+    #### 2. Company Health Checker
+    - 6-dimensional health analysis
+    - AI-generated pros and cons
+    - Risk assessment
+    - Investment recommendations
+    
+    #### 3. Advanced Analytics
+    - 59 engineered features per company
+    - Composite scoring (Quality, Value, Growth, Momentum)
+    - Altman Z-Score for bankruptcy prediction
+    - Sector-relative performance metrics
+    
+    ### 🔧 Technology Stack
+    
+    - **Python 3.12**: Core language
+    - **Streamlit**: Web interface
+    - **Pandas**: Data manipulation
+    - **Plotly**: Interactive visualizations
+    - **yfinance**: Market data
+    
+    ### 📊 Data Coverage
+    
+    - **Companies**: 102 major US stocks
+    - **Sectors**: 11 industry sectors
+    - **Features**: 59 per company
+    - **Update Frequency**: Daily (recommended)
+    
+    ### 🎯 Scoring Methodology
+    
+    **Health Score (0-100%)**:
+    - Financial Strength (25%)
+    - Profitability (20%)
+    - Growth Trajectory (20%)
+    - Valuation (15%)
+    - Risk Management (10%)
+    - Market Position (10%)
+    
+    **Ranking Score**:
+    - Composite Score (30%)
+    - Quality Score (20%)
+    - Growth Score (20%)
+    - Value Score (15%)
+    - Momentum Score (15%)
+    
+    ### ⚠️ Disclaimer
+    
+    This tool is for **educational and informational purposes only**.
+    - Not financial advice
+    - Past performance ≠ future results
+    - Always consult a licensed financial advisor
+    - Conduct your own due diligence
+    
+    ### 📧 Contact
+    
+    Built by: Muhammed Shaheem OP
+    
+    Date: February 2026  
+    Purpose: HNI Investment Platform
+    
+    ---
+    
+    **Version**: 1.0.0  
+    **Last Updated**: February 10, 2026
+    """)
+
+# Radio label -> page renderer; one dict probe replaces the if/elif
+# chain and keeps each page behind its own lazy plotly import
+PAGES = {
+    "🏠 Dashboard": show_dashboard,
+    "🏆 Portfolio Recommendations": show_portfolio,
+    "🏥 Company Health Checker": show_health_checker,
+    "📊 Market Overview": show_market_overview,
+    "ℹ️ About": show_about,
+}
+
+@st.fragment(run_every=60)
+def _sidebar_status():
+    """Data freshness indicator
+
+    A fragment with run_every keeps the label current without
+    rerunning the whole script once a minute.
+    """
+    css_class, label = get_data_file_status(_data_mtime())
+    st.markdown(f'<div class="{css_class}">{label}</div>',
+                unsafe_allow_html=True)
+
+def main():
+    """Main application"""
+    
+    # Header
+    st.markdown('<p class="main-header">📈 HNI Investment Intelligence Platform</p>', unsafe_allow_html=True)
+    st.markdown("### AI-Powered Stock Analysis & Portfolio Recommendations")
+    
+    # Sidebar navigation
+    st.sidebar.title("🎯 Navigation")
+    page = st.sidebar.radio("Select Page", list(PAGES))
+    
+    # Data freshness indicator
+    with st.sidebar:
+        _sidebar_status()
+
+    # Start the ranking pass in the background so it overlaps with the
+    # user's first page instead of blocking the Portfolio page later
+    _rankings_future()
+
+    PAGES[page]()
 
 if __name__ == "__main__":
     main()
@@ -5,7 +5,7 @@ import os
 sys.path.append(os.path.dirname(__file__))
 
 from src.data.collectors import StockDataCollector
-import pandas as pd
+from src.utils.helpers import write_df
 
 def main():
     print("\n" + "="*80)
@@ -28,16 +28,17 @@ def main():
     print("KEY METRICS:")
     print("-" * 80)
     
-    for idx, row in df.iterrows():
-        print(f"\n{row['symbol']} - {row['company_name']}")
-        print(f"  Price: ${row['current_price']:.2f}")
-        print(f"  Market Cap: ${row['market_cap']/1e9:.2f}B")
-        print(f"  P/E Ratio: {row['pe_ratio']:.2f}")
-        print(f"  Profit Margin: {row['profit_margin']*100:.2f}%")
-        print(f"  Beta: {row['beta']:.2f}")
-    
-    output_file = 'data/processed/test_results.csv'
-    df.to_csv(output_file, index=False)
+    for row in df.itertuples(index=False):
+        print(f"\n{row.symbol} - {row.company_name}")
+        print(f"  Price: ${row.current_price:.2f}")
+        print(f"  Market Cap: ${row.market_cap/1e9:.2f}B")
+        print(f"  P/E Ratio: {row.pe_ratio:.2f}")
+        print(f"  Profit Margin: {row.profit_margin*100:.2f}%")
+        print(f"  Beta: {row.beta:.2f}")
+    
+    # Parquet via the shared pyarrow writer, with a CSV sibling for
+    # eyeballing the handful of test rows
+    output_file = write_df(df, 'data/processed/test_results', also_csv=True)
     
     print("\n" + "="*80)
     print(f"💾 Data saved to: {output_file}")
@@ -20,16 +20,13 @@ def main():
     
     print("Testing with sample companies...\n")
     
-    for symbol in test_symbols:
+    # Analyze the whole batch up front - one matrix product instead of
+    # five separate lookups - then page through the finished results
+    analyses = scorer.analyze_many(test_symbols)
+
+    for analysis in analyses:
         print("\n" + "█"*80)
-        
-        # Analyze
-        analysis = scorer.analyze_company(symbol)
-        
-        # Format and print
         print(scorer.format_analysis(analysis))
-        
-        input("\nPress Enter to continue to next company...")
     
     # Interactive mode
     print("\n" + "="*80)
@@ -2,25 +2,35 @@
 Update category files with engineered features
 """
 
-import pandas as pd
+import os
+
 from src.data.universe import universe_builder
+from src.utils.helpers import read_category, read_df, write_categories, write_df
+
+STEM = 'data/processed/stock_universe_engineered'
 
 print("\n" + "="*80)
 print("🔄 UPDATING CATEGORY FILES WITH ENGINEERED FEATURES")
 print("="*80 + "\n")
 
-# Load the full engineered dataset
+# Load the full engineered dataset (Parquet preferred over legacy CSV)
 print("Loading engineered dataset...")
-df_full = pd.read_csv('data/processed/stock_universe_engineered.csv')
+df_full = read_df(STEM)
 print(f"Loaded {len(df_full)} companies with {len(df_full.columns)} features")
 
-# Recreate categories with all features
+# One-shot migration: leave a Parquet sibling behind so every later
+# load - including the Streamlit cold start - skips the CSV parse
+if not os.path.exists(f'{STEM}.parquet'):
+    write_df(df_full, STEM)
+    print("  ✓ Wrote Parquet sibling for the engineered dataset")
+
+# Recreate categories with all features; one partitioned-dataset write
+# replaces four pandas to_csv passes (per-row Python float formatting)
 print("\nRecreating category files...")
 categories = universe_builder.categorize_by_market_cap(df_full)
+write_categories(categories)
 
 for cat_name, cat_df in categories.items():
-    filename = f'data/processed/category_{cat_name}.csv'
-    cat_df.to_csv(filename, index=False)
     print(f"  ✓ Updated {cat_name}: {len(cat_df)} companies with {len(cat_df.columns)} features")
 
 print("\n" + "="*80)
@@ -30,7 +40,7 @@ print("="*80 + "\n")
 # Verify the update
 print("Verifying composite_score is present...")
 for cat_name in ['mag7', 'giant', 'large', 'mid']:
-    cat_df = pd.read_csv(f'data/processed/category_{cat_name}.csv')
+    cat_df = read_category(cat_name)
     if 'composite_score' in cat_df.columns:
         print(f"  ✓ {cat_name}: composite_score present (avg: {cat_df['composite_score'].mean():.2f})")
     else: